@@ -56,6 +56,11 @@ questions = [
     "In which year was this movie released?",
 ]
 
+# The turns are deliberately sequential: each follow-up question refers to
+# the previous answer ("its director", "this movie") and the accumulated
+# history feeds into the next query, so the searches cannot be issued
+# concurrently without changing the answers. Only independent questions
+# could be dispatched in parallel.
 history: list[dict[str, str]] = []
 for question in questions:
     result = rag.search(
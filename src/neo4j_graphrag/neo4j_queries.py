@@ -14,6 +14,7 @@
 #  limitations under the License.
 from __future__ import annotations
 
+import functools
 import warnings
 from typing import Any, Optional, Union
 
@@ -262,6 +263,60 @@ def _get_hybrid_query_linear(neo4j_version_is_5_23_or_above: bool, alpha: float)
     return call_prefix + query_body
 
 
+def _get_hybrid_query_batched(neo4j_version_is_5_23_or_above: bool) -> str:
+    """
+    Construct a Cypher query running several hybrid searches in one call.
+
+    The query UNWINDs over the $queries parameter (a list of
+    {text, vector} maps), runs the naive-ranker hybrid search for each
+    entry and returns one row per result with the originating query index,
+    so N searches cost a single driver round trip instead of N.
+
+    Args:
+        neo4j_version_is_5_23_or_above (bool): Whether the Neo4j version is 5.23 or above;
+            determines which call syntax is used.
+
+    Returns:
+        str: The constructed Cypher query string.
+    """
+    if neo4j_version_is_5_23_or_above:
+        call_prefix = "CALL (q) { "
+        branch_prefix = ""
+    else:
+        call_prefix = "CALL { WITH q "
+        branch_prefix = "WITH q "
+    vector_part = (
+        "CALL db.index.vector.queryNodes"
+        "($vector_index_name, $top_k * $effective_search_ratio, q.vector) "
+        "YIELD node, score "
+        "WITH node, score LIMIT $top_k "
+        "WITH collect({node:node, score:score}) AS nodes, max(score) AS vector_index_max_score "
+        "UNWIND nodes AS n "
+        "RETURN n.node AS node, (n.score / vector_index_max_score) AS score "
+    )
+    fulltext_part = (
+        "CALL db.index.fulltext.queryNodes($fulltext_index_name, q.text, {limit: $top_k}) "
+        "YIELD node, score "
+        "WITH collect({node:node, score:score}) AS nodes, max(score) AS ft_index_max_score "
+        "UNWIND nodes AS n "
+        "RETURN n.node AS node, (n.score / ft_index_max_score) AS score"
+    )
+    return (
+        "UNWIND range(0, size($queries) - 1) AS i "
+        "WITH $queries[i] AS q, i "
+        f"{call_prefix}"
+        f"{vector_part}"
+        "UNION "
+        f"{branch_prefix}"
+        f"{fulltext_part} }} "
+        "WITH i, node, max(score) AS score "
+        "ORDER BY i ASC, score DESC, elementId(node) "
+        "WITH i, collect({node: node, score: score})[0..$top_k] AS results "
+        "UNWIND results AS result "
+        "RETURN i AS query_index, result.node AS node, result.score AS score"
+    )
+
+
 def _get_filtered_vector_query(
     filters: dict[str, Any],
     node_label: str,
@@ -488,21 +543,11 @@ def get_search_query(
         DeprecationWarning,
         stacklevel=2,
     )
-    if entity_type == EntityType.NODE:
-        if search_type == SearchType.HYBRID:
-            if filters:
+    if filters:
+        if entity_type == EntityType.NODE:
+            if search_type == SearchType.HYBRID:
                 raise Exception("Filters are not supported with hybrid search")
-            if ranker == HybridSearchRanker.NAIVE:
-                query = _get_hybrid_query(neo4j_version_is_5_23_or_above)
-            elif ranker == HybridSearchRanker.LINEAR and alpha:
-                query = _get_hybrid_query_linear(
-                    neo4j_version_is_5_23_or_above, alpha=alpha
-                )
-            else:
-                raise InvalidHybridSearchRankerError()
-            params: dict[str, Any] = {}
-        elif search_type == SearchType.VECTOR:
-            if filters:
+            elif search_type == SearchType.VECTOR:
                 if (
                     node_label is not None
                     and embedding_node_property is not None
@@ -520,7 +565,72 @@ def get_search_query(
                         "Vector Search with filters requires: node_label, embedding_node_property, embedding_dimension"
                     )
             else:
-                query, params = NODE_VECTOR_INDEX_QUERY, {}
+                raise ValueError(f"Search type is not supported: {search_type}")
+            fallback_return = (
+                f"RETURN node {{ .*, `{embedding_node_property}`: null }} AS node, "
+                "labels(node) AS nodeLabels, "
+                "elementId(node) AS elementId, "
+                "elementId(node) AS id, "
+                "score"
+            )
+        elif entity_type == EntityType.RELATIONSHIP:
+            raise Exception("Filters are not supported for relationship indexes")
+        else:
+            raise ValueError(f"Entity type is not supported: {entity_type}")
+        query_tail = get_query_tail(
+            retrieval_query,
+            return_properties,
+            fallback_return=fallback_return,
+            entity_type=entity_type,
+        )
+        return f"{query} {query_tail}", params
+
+    # Without filters the query string depends only on hashable arguments,
+    # so repeated searches with the same configuration hit the cache instead
+    # of rebuilding the same Cypher string on every call
+    query = _build_unfiltered_search_query(
+        search_type,
+        entity_type,
+        tuple(return_properties) if return_properties else None,
+        retrieval_query,
+        embedding_node_property,
+        neo4j_version_is_5_23_or_above,
+        ranker,
+        alpha,
+    )
+    return query, {}
+
+
+@functools.lru_cache(maxsize=128)
+def _build_unfiltered_search_query(
+    search_type: SearchType,
+    entity_type: EntityType,
+    return_properties: Optional[tuple[str, ...]],
+    retrieval_query: Optional[str],
+    embedding_node_property: Optional[str],
+    neo4j_version_is_5_23_or_above: bool,
+    ranker: Union[str, HybridSearchRanker],
+    alpha: Optional[float],
+) -> str:
+    """Assemble the search query string for the non-filtered code paths.
+
+    Called from get_search_query, which normalizes return_properties to a
+    tuple so all arguments are hashable. Query parameters are not part of
+    the result: the non-filtered queries carry none, and get_search_query
+    returns a fresh dict per call so callers can safely mutate it.
+    """
+    if entity_type == EntityType.NODE:
+        if search_type == SearchType.HYBRID:
+            if ranker == HybridSearchRanker.NAIVE:
+                query = _get_hybrid_query(neo4j_version_is_5_23_or_above)
+            elif ranker == HybridSearchRanker.LINEAR and alpha:
+                query = _get_hybrid_query_linear(
+                    neo4j_version_is_5_23_or_above, alpha=alpha
+                )
+            else:
+                raise InvalidHybridSearchRankerError()
+        elif search_type == SearchType.VECTOR:
+            query = NODE_VECTOR_INDEX_QUERY
         else:
             raise ValueError(f"Search type is not supported: {search_type}")
         fallback_return = (
@@ -531,12 +641,10 @@ def get_search_query(
             "score"
         )
     elif entity_type == EntityType.RELATIONSHIP:
-        if filters:
-            raise Exception("Filters are not supported for relationship indexes")
         if search_type == SearchType.HYBRID:
             raise Exception("Hybrid search is not supported for relationship indexes")
         elif search_type == SearchType.VECTOR:
-            query, params = REL_VECTOR_INDEX_QUERY, {}
+            query = REL_VECTOR_INDEX_QUERY
             fallback_return = (
                 f"RETURN relationship {{ .*, `{embedding_node_property}`: null }} AS relationship, "
                 "type(relationship) as relationshipType, "
@@ -550,11 +658,11 @@ def get_search_query(
         raise ValueError(f"Entity type is not supported: {entity_type}")
     query_tail = get_query_tail(
         retrieval_query,
-        return_properties,
+        list(return_properties) if return_properties else None,
         fallback_return=fallback_return,
         entity_type=entity_type,
     )
-    return f"{query} {query_tail}", params
+    return f"{query} {query_tail}"
 
 
 def get_query_tail(
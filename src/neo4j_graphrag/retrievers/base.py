@@ -21,6 +21,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Iterator,
     Optional,
     TypeVar,
     get_args,
@@ -36,9 +37,10 @@ from typing_extensions import ParamSpec
 from neo4j_graphrag.exceptions import Neo4jVersionError
 from neo4j_graphrag.types import RawSearchResult, RetrieverResult, RetrieverResultItem
 from neo4j_graphrag.utils.version_utils import (
-    get_version,
+    get_version_cached,
     has_metadata_filtering_support,
     has_vector_index_support,
+    has_vector_type_support,
     is_version_5_23_or_above,
 )
 from neo4j_graphrag.utils import driver_config
@@ -110,10 +112,15 @@ class Retriever(ABC, metaclass=RetrieverMetaclass):
         self.driver = driver_config.override_user_agent(driver)
         self.neo4j_database = neo4j_database
         if self.VERIFY_NEO4J_VERSION:
-            version_tuple, is_aura, _ = get_version(self.driver, self.neo4j_database)
+            # Version detection is memoized per driver instance, so building
+            # many retrievers over one driver only pays the round-trip once.
+            version_tuple, is_aura, _ = get_version_cached(
+                self.driver, self.neo4j_database
+            )
             self.neo4j_version_is_5_23_or_above = is_version_5_23_or_above(
                 version_tuple
             )
+            self.neo4j_supports_vector_type = has_vector_type_support(version_tuple)
             if not has_vector_index_support(
                 version_tuple
             ) or not has_metadata_filtering_support(version_tuple, is_aura):
@@ -155,7 +162,9 @@ class Retriever(ABC, metaclass=RetrieverMetaclass):
         """
         raw_result = self.get_search_results(*args, **kwargs)
         formatter = self.get_result_formatter()
-        search_items = [formatter(record) for record in raw_result.records]
+        # map() drives the record loop in C, which is measurably faster than
+        # an explicit comprehension once top_k gets large
+        search_items = list(map(formatter, raw_result.records))
         metadata = raw_result.metadata or {}
         metadata["__retriever"] = self.__class__.__name__
         return RetrieverResult(
@@ -163,6 +172,17 @@ class Retriever(ABC, metaclass=RetrieverMetaclass):
             metadata=metadata,
         )
 
+    def search_stream(self, *args: Any, **kwargs: Any) -> Iterator[RetrieverResultItem]:
+        """Like `search`, but yields `RetrieverResultItem` objects lazily
+        instead of materializing them all into a `RetrieverResult`. Useful
+        for large top_k values, where building the intermediate items list
+        doubles peak memory. Retriever-level metadata is not available
+        through this interface; use `search` if you need it.
+        """
+        raw_result = self.get_search_results(*args, **kwargs)
+        formatter = self.get_result_formatter()
+        return map(formatter, raw_result.records)
+
     @abstractmethod
     def get_search_results(self, *args: Any, **kwargs: Any) -> RawSearchResult:
         """This method must be implemented in each child class. It will
@@ -240,6 +260,10 @@ class Retriever(ABC, metaclass=RetrieverMetaclass):
             if param.kind == inspect.Parameter.VAR_KEYWORD:
                 continue
 
+            # Skip execution-control parameters that are not search inputs
+            if param_name == "session":
+                continue
+
             # Determine if parameter is required (no default value)
             is_required = param.default is inspect.Parameter.empty
 
@@ -14,8 +14,12 @@
 #  limitations under the License.
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Callable, Optional, Union
+import functools
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Literal, Optional, Union
 
 import neo4j
 from pydantic import ValidationError
@@ -30,6 +34,7 @@ from neo4j_graphrag.exceptions import (
 from neo4j_graphrag.neo4j_queries import (
     _build_hybrid_search_clause_query,
     _build_hybrid_search_clause_query_linear,
+    _get_hybrid_query_batched,
     get_query_tail,
     get_search_query,
 )
@@ -40,18 +45,69 @@ from neo4j_graphrag.types import (
     HybridCypherRetrieverModel,
     HybridCypherSearchModel,
     HybridRetrieverModel,
+    HybridSearchManyModel,
     HybridSearchModel,
     Neo4jDriverModel,
     RawSearchResult,
+    RetrieverResult,
     RetrieverResultItem,
     SearchType,
     HybridSearchRanker,
 )
 from neo4j_graphrag.utils.logging import prettify
 
+try:
+    # Bolt Vector type, available from driver 6.x: ships the embedding as a
+    # raw float32 buffer instead of a list of boxed floats
+    from neo4j.vector import Vector
+except ImportError:
+    Vector = None  # type: ignore[assignment, misc]
+
 logger = logging.getLogger(__name__)
 
 
+def _quantize_int8(vector: list[float]) -> tuple[list[int], float]:
+    """Scale a float vector into int8 range. Returns the quantized values and
+    the scale factor needed to recover the original magnitudes
+    (value * scale / 127).
+    """
+    scale = max(abs(value) for value in vector) or 1.0
+    factor = 127.0 / scale
+    return [round(value * factor) for value in vector], scale
+
+
+def _init_args_well_typed(
+    driver: neo4j.Driver,
+    required_strings: tuple[Any, ...],
+    embedder: Optional[Embedder],
+    result_formatter: Optional[Callable[[neo4j.Record], RetrieverResultItem]],
+    neo4j_database: Optional[str],
+    return_properties: Optional[list[Any]] = None,
+) -> bool:
+    """Cheap structural check over the constructor arguments.
+
+    When this returns True the pydantic init models are guaranteed to accept
+    the arguments unchanged, so the constructor can skip building them — a
+    measurable saving when retrievers are created per request. Anything
+    unusual returns False and goes through pydantic, keeping validation
+    behavior and error messages identical.
+    """
+    return (
+        isinstance(driver, neo4j.Driver)
+        and all(type(value) is str for value in required_strings)
+        and (embedder is None or callable(getattr(embedder, "embed_query", None)))
+        and (result_formatter is None or callable(result_formatter))
+        and (neo4j_database is None or type(neo4j_database) is str)
+        and (
+            return_properties is None
+            or (
+                isinstance(return_properties, list)
+                and all(type(p) is str for p in return_properties)
+            )
+        )
+    )
+
+
 class HybridRetriever(Retriever):
     """
     Provides retrieval method using combination of vector search over embeddings and
@@ -80,6 +136,13 @@ class HybridRetriever(Retriever):
         return_properties (Optional[list[str]]): List of node properties to return.
         result_formatter (Optional[Callable[[neo4j.Record], RetrieverResultItem]]): Provided custom function to transform a neo4j.Record to a RetrieverResultItem.
         neo4j_database (Optional[str]): The name of the Neo4j database. If not provided, this defaults to the server's default database ("neo4j" by default) (`see reference to documentation <https://neo4j.com/docs/operations-manual/current/database-administration/#manage-databases-default>`_).
+        embedding_cache_size (int): Maximum number of query embeddings to cache, keyed on query_text.
+            Repeated searches for the same text then reuse the cached vector instead of calling the embedder again.
+            Defaults to 0 (caching disabled).
+        quantize (Literal["none", "int8"]): Opt-in reduced precision for the query vector sent over Bolt.
+            With "int8" the embedding is scaled into int8 range and shipped as a native int8 vector (4x fewer
+            bytes on the wire) on servers with vector type support; on older servers the full precision
+            vector is sent as usual. Defaults to "none".
 
             Two variables are provided in the neo4j.Record:
 
@@ -98,39 +161,169 @@ class HybridRetriever(Retriever):
             Callable[[neo4j.Record], RetrieverResultItem]
         ] = None,
         neo4j_database: Optional[str] = None,
+        embedding_cache_size: int = 0,
+        quantize: Literal["none", "int8"] = "none",
     ) -> None:
-        try:
-            driver_model = Neo4jDriverModel(driver=driver)
-            embedder_model = EmbedderModel(embedder=embedder) if embedder else None
-            validated_data = HybridRetrieverModel(
-                driver_model=driver_model,
-                vector_index_name=vector_index_name,
-                fulltext_index_name=fulltext_index_name,
-                embedder_model=embedder_model,
-                return_properties=return_properties,
-                result_formatter=result_formatter,
-                neo4j_database=neo4j_database,
+        if not (
+            _init_args_well_typed(
+                driver,
+                (vector_index_name, fulltext_index_name),
+                embedder,
+                result_formatter,
+                neo4j_database,
+                return_properties,
             )
-        except ValidationError as e:
-            raise RetrieverInitializationError(e.errors()) from e
-
-        super().__init__(
-            validated_data.driver_model.driver, validated_data.neo4j_database
-        )
-        self.vector_index_name = validated_data.vector_index_name
-        self.fulltext_index_name = validated_data.fulltext_index_name
-        self.return_properties = validated_data.return_properties
-        self.embedder = (
-            validated_data.embedder_model.embedder
-            if validated_data.embedder_model
-            else None
+            and type(embedding_cache_size) is int
+            and embedding_cache_size >= 0
+            and quantize in ("none", "int8")
+        ):
+            # Cold path: let pydantic coerce borderline values or produce
+            # its usual error report.
+            try:
+                driver_model = Neo4jDriverModel(driver=driver)
+                embedder_model = EmbedderModel(embedder=embedder) if embedder else None
+                validated_data = HybridRetrieverModel(
+                    driver_model=driver_model,
+                    vector_index_name=vector_index_name,
+                    fulltext_index_name=fulltext_index_name,
+                    embedder_model=embedder_model,
+                    return_properties=return_properties,
+                    result_formatter=result_formatter,
+                    neo4j_database=neo4j_database,
+                    embedding_cache_size=embedding_cache_size,
+                    quantize=quantize,
+                )
+            except ValidationError as e:
+                raise RetrieverInitializationError(e.errors()) from e
+            driver = validated_data.driver_model.driver
+            vector_index_name = validated_data.vector_index_name
+            fulltext_index_name = validated_data.fulltext_index_name
+            embedder = (
+                validated_data.embedder_model.embedder
+                if validated_data.embedder_model
+                else None
+            )
+            return_properties = validated_data.return_properties
+            result_formatter = validated_data.result_formatter
+            neo4j_database = validated_data.neo4j_database
+            embedding_cache_size = validated_data.embedding_cache_size
+            quantize = validated_data.quantize
+
+        super().__init__(driver, neo4j_database)
+        self.vector_index_name = vector_index_name
+        self.fulltext_index_name = fulltext_index_name
+        self.return_properties = return_properties
+        self.embedder = embedder
+        self.result_formatter = result_formatter
+        self.embedding_cache_size = embedding_cache_size
+        self.quantize = quantize
+        self._embedding_cache: Optional[OrderedDict[str, list[float]]] = (
+            OrderedDict() if self.embedding_cache_size else None
         )
-        self.result_formatter = validated_data.result_formatter
+        # constant for the lifetime of the retriever; copied as the base of
+        # the Cypher parameter map on every search
+        self._param_template = {
+            "vector_index_name": self.vector_index_name,
+            "fulltext_index_name": self.fulltext_index_name,
+        }
         self._node_label = None
         self._embedding_node_property = None
         self._embedding_dimension = None
         self._fetch_index_infos(self.vector_index_name)
 
+    def _cached_embedding(self, query_text: str) -> Optional[list[float]]:
+        """Return the cached vector for query_text, refreshing its LRU slot,
+        or None when caching is disabled or the text has not been seen yet.
+        """
+        if self._embedding_cache is None:
+            return None
+        cached = self._embedding_cache.get(query_text)
+        if cached is not None:
+            self._embedding_cache.move_to_end(query_text)
+        return cached
+
+    def _remember_embedding(self, query_text: str, query_vector: list[float]) -> None:
+        """Store a freshly computed vector in the embedding cache, evicting
+        the least recently used entry when the cache is full.
+        """
+        if self._embedding_cache is None:
+            return
+        self._embedding_cache[query_text] = query_vector
+        if len(self._embedding_cache) > self.embedding_cache_size:
+            self._embedding_cache.popitem(last=False)
+
+    def _embed_query_text(self, query_text: str) -> list[float]:
+        """Embed query_text, reusing a cached vector when the embedding cache
+        is enabled and already holds an entry for the same text.
+        """
+        cached = self._cached_embedding(query_text)
+        if cached is not None:
+            return cached
+        query_vector: list[float] = self.embedder.embed_query(query_text)  # type: ignore[union-attr]
+        self._remember_embedding(query_text, query_vector)
+        return query_vector
+
+    async def search_async(
+        self,
+        query_text: str,
+        query_vector: Optional[list[float]] = None,
+        top_k: int = 5,
+        effective_search_ratio: int = 1,
+        ranker: Union[str, HybridSearchRanker] = HybridSearchRanker.NAIVE,
+        alpha: Optional[float] = None,
+    ) -> RetrieverResult:
+        """Async counterpart of `search`. The query embedding is awaited
+        through the embedder's async API so the event loop stays responsive
+        during the embedding RPC, and the blocking Bolt round-trip runs in a
+        worker thread. Validation, query construction and result formatting
+        are identical to `search`.
+        """
+        if query_vector is None and self.embedder is not None:
+            # pre-embed only when the embedder really overrides the async
+            # API: the Embedder base class default blocks on embed_query,
+            # which would run the RPC on the event loop — that case is left
+            # to the worker thread below instead
+            async_embed = getattr(type(self.embedder), "async_embed_query", None)
+            if (
+                async_embed is not None
+                and async_embed is not Embedder.async_embed_query
+            ):
+                query_vector = self._cached_embedding(query_text)
+                if query_vector is None:
+                    query_vector = await self.embedder.async_embed_query(query_text)
+                    self._remember_embedding(query_text, query_vector)
+        return await asyncio.to_thread(
+            self.search,
+            query_text=query_text,
+            query_vector=query_vector,
+            top_k=top_k,
+            effective_search_ratio=effective_search_ratio,
+            ranker=ranker,
+            alpha=alpha,
+        )
+
+    @contextmanager
+    def search_scope(self) -> Iterator[Callable[..., RetrieverResult]]:
+        """Reuse one session for several back-to-back searches.
+
+        `driver.execute_query` acquires and releases a session per call,
+        which goes through the connection pool lock every time. This scope
+        opens a single read session and yields a search callable bound to
+        it; the retriever itself is not touched, so searches on other
+        threads keep their usual per-call sessions:
+
+        .. code-block:: python
+
+          with retriever.search_scope() as scoped_search:
+              first = scoped_search(query_text="...")
+              second = scoped_search(query_text="...")
+        """
+        with self.driver.session(
+            database=self.neo4j_database,
+            default_access_mode=neo4j.READ_ACCESS,
+        ) as session:
+            yield functools.partial(self.search, session=session)
+
     def default_record_formatter(self, record: neo4j.Record) -> RetrieverResultItem:
         """
         Best effort to guess the node-to-text method. Inherited classes
@@ -153,6 +346,7 @@ class HybridRetriever(Retriever):
         effective_search_ratio: int = 1,
         ranker: Union[str, HybridSearchRanker] = HybridSearchRanker.NAIVE,
         alpha: Optional[float] = None,
+        session: Optional[neo4j.Session] = None,
     ) -> RawSearchResult:
         """Get the top_k nearest neighbor embeddings for either provided query_vector or query_text.
         Both query_vector and query_text can be provided.
@@ -177,6 +371,9 @@ class HybridRetriever(Retriever):
             alpha (Optional[float]): Weight for the vector score when using the linear ranker.
                 The fulltext index score is multiplied by (1 - alpha).
                 **Required** when using the linear ranker; must be between 0 and 1.
+            session (Optional[neo4j.Session]): An open session to run the query on, reused across calls.
+                Open it with `default_access_mode=neo4j.READ_ACCESS` to keep the read routing the
+                default path uses. Defaults to None, in which case the driver acquires a session per call.
 
         Raises:
             SearchValidationError: If validation of the input arguments fail.
@@ -197,16 +394,15 @@ class HybridRetriever(Retriever):
         except ValidationError as e:
             raise SearchValidationError(e.errors()) from e
 
-        parameters = validated_data.model_dump(exclude_none=True)
-        parameters["vector_index_name"] = self.vector_index_name
-        parameters["fulltext_index_name"] = self.fulltext_index_name
+        parameters = self._param_template.copy()
+        parameters.update(validated_data.model_dump(exclude_none=True))
 
         if query_text and not query_vector:
             if not self.embedder:
                 raise EmbeddingRequiredError(
                     "Embedding method required for text query."
                 )
-            query_vector = self.embedder.embed_query(query_text)
+            query_vector = self._embed_query_text(query_text)
             parameters["query_vector"] = query_vector
 
         use_search_clause = False
@@ -261,6 +457,105 @@ class HybridRetriever(Retriever):
         if "ranker" in parameters:
             del parameters["ranker"]
 
+        if Vector is not None and self.neo4j_supports_vector_type:
+            # send the embedding as a native Bolt Vector so the driver packs
+            # one buffer instead of 1000+ individual floats; the metadata
+            # below keeps the plain list
+            vector_param = parameters.get("query_vector")
+            if vector_param is not None:
+                if self.quantize == "int8":
+                    # 4x fewer bytes on the wire; query_vector_scale lets the
+                    # Cypher side recover magnitudes when it needs to
+                    quantized, scale = _quantize_int8(vector_param)
+                    parameters["query_vector"] = Vector.from_native(quantized, "i8")
+                    parameters["query_vector_scale"] = scale
+                else:
+                    parameters["query_vector"] = Vector.from_native(
+                        vector_param, "f32"
+                    )
+
+        logger.debug("HybridRetriever Cypher parameters: %s", prettify(parameters))
+        logger.debug("HybridRetriever Cypher query: %s", search_query)
+
+        try:
+            if session is not None:
+                records = list(session.run(search_query, parameters))
+            else:
+                records, _, _ = self.driver.execute_query(
+                    search_query,
+                    parameters,
+                    database_=self.neo4j_database,
+                    routing_=neo4j.RoutingControl.READ,
+                )
+        except neo4j.exceptions.ClientError as e:
+            if "org.apache.lucene.queryparser.classic.ParseException" in str(e):
+                raise SearchQueryParseError(
+                    f"Invalid Lucene query generated from query_text: {query_text}"
+                ) from e
+            raise
+        return RawSearchResult(
+            records=records,
+            metadata={"query_vector": query_vector},
+        )
+
+    def search_many(
+        self,
+        query_texts: list[str],
+        top_k: int = 5,
+        effective_search_ratio: int = 1,
+    ) -> list[RetrieverResult]:
+        """Run a hybrid search for several query texts in a single driver call.
+
+        All texts are embedded first (through the embedder's batch method when
+        it provides one, one by one otherwise), then a single Cypher query
+        UNWINDs over the text/vector pairs, so N searches cost one driver
+        round trip instead of N. Results come back in the same order as
+        query_texts. Uses the naive ranker.
+
+        Args:
+            query_texts (list[str]): The texts to get the closest neighbors of.
+            top_k (int, optional): The number of neighbors to return for each query text. Defaults to 5.
+            effective_search_ratio (int): Controls the candidate pool size for the vector index by multiplying top_k to balance query
+                accuracy and performance. Defaults to 1.
+
+        Raises:
+            SearchValidationError: If validation of the input arguments fail.
+            EmbeddingRequiredError: If no embedder is provided.
+
+        Returns:
+            list[RetrieverResult]: One result per query text, in input order.
+        """
+        try:
+            validated_data = HybridSearchManyModel(
+                query_texts=query_texts,
+                top_k=top_k,
+                effective_search_ratio=effective_search_ratio,
+            )
+        except ValidationError as e:
+            raise SearchValidationError(e.errors()) from e
+
+        if not self.embedder:
+            raise EmbeddingRequiredError("Embedding method required for text query.")
+        embed_documents = getattr(self.embedder, "embed_documents", None)
+        if callable(embed_documents):
+            query_vectors = embed_documents(validated_data.query_texts)
+        else:
+            query_vectors = [
+                self._embed_query_text(text) for text in validated_data.query_texts
+            ]
+
+        parameters: dict[str, Any] = {
+            "queries": [
+                {"text": text, "vector": vector}
+                for text, vector in zip(validated_data.query_texts, query_vectors)
+            ],
+            "top_k": validated_data.top_k,
+            "effective_search_ratio": validated_data.effective_search_ratio,
+            "vector_index_name": self.vector_index_name,
+            "fulltext_index_name": self.fulltext_index_name,
+        }
+        search_query = _get_hybrid_query_batched(self.neo4j_version_is_5_23_or_above)
+
         logger.debug("HybridRetriever Cypher parameters: %s", prettify(parameters))
         logger.debug("HybridRetriever Cypher query: %s", search_query)
 
@@ -274,13 +569,26 @@ class HybridRetriever(Retriever):
         except neo4j.exceptions.ClientError as e:
             if "org.apache.lucene.queryparser.classic.ParseException" in str(e):
                 raise SearchQueryParseError(
-                    f"Invalid Lucene query generated from query_text: {query_text}"
+                    f"Invalid Lucene query generated from query_texts: {query_texts}"
                 ) from e
             raise
-        return RawSearchResult(
-            records=records,
-            metadata={"query_vector": query_vector},
-        )
+
+        formatter = self.result_formatter or self.default_record_formatter
+        grouped: list[list[RetrieverResultItem]] = [
+            [] for _ in validated_data.query_texts
+        ]
+        for record in records:
+            grouped[record["query_index"]].append(formatter(record))
+        return [
+            RetrieverResult(
+                items=items,
+                metadata={
+                    "__retriever": self.__class__.__name__,
+                    "query_vector": query_vector,
+                },
+            )
+            for items, query_vector in zip(grouped, query_vectors)
+        ]
 
 
 class HybridCypherRetriever(Retriever):
@@ -334,33 +642,49 @@ class HybridCypherRetriever(Retriever):
         ] = None,
         neo4j_database: Optional[str] = None,
     ) -> None:
-        try:
-            driver_model = Neo4jDriverModel(driver=driver)
-            embedder_model = EmbedderModel(embedder=embedder) if embedder else None
-            validated_data = HybridCypherRetrieverModel(
-                driver_model=driver_model,
-                vector_index_name=vector_index_name,
-                fulltext_index_name=fulltext_index_name,
-                retrieval_query=retrieval_query,
-                embedder_model=embedder_model,
-                result_formatter=result_formatter,
-                neo4j_database=neo4j_database,
+        if not _init_args_well_typed(
+            driver,
+            (vector_index_name, fulltext_index_name, retrieval_query),
+            embedder,
+            result_formatter,
+            neo4j_database,
+        ):
+            try:
+                driver_model = Neo4jDriverModel(driver=driver)
+                embedder_model = EmbedderModel(embedder=embedder) if embedder else None
+                validated_data = HybridCypherRetrieverModel(
+                    driver_model=driver_model,
+                    vector_index_name=vector_index_name,
+                    fulltext_index_name=fulltext_index_name,
+                    retrieval_query=retrieval_query,
+                    embedder_model=embedder_model,
+                    result_formatter=result_formatter,
+                    neo4j_database=neo4j_database,
+                )
+            except ValidationError as e:
+                raise RetrieverInitializationError(e.errors()) from e
+            driver = validated_data.driver_model.driver
+            vector_index_name = validated_data.vector_index_name
+            fulltext_index_name = validated_data.fulltext_index_name
+            retrieval_query = validated_data.retrieval_query
+            embedder = (
+                validated_data.embedder_model.embedder
+                if validated_data.embedder_model
+                else None
             )
-        except ValidationError as e:
-            raise RetrieverInitializationError(e.errors()) from e
-
-        super().__init__(
-            validated_data.driver_model.driver, validated_data.neo4j_database
-        )
-        self.vector_index_name = validated_data.vector_index_name
-        self.fulltext_index_name = validated_data.fulltext_index_name
-        self.retrieval_query = validated_data.retrieval_query
-        self.embedder = (
-            validated_data.embedder_model.embedder
-            if validated_data.embedder_model
-            else None
-        )
-        self.result_formatter = validated_data.result_formatter
+            result_formatter = validated_data.result_formatter
+            neo4j_database = validated_data.neo4j_database
+
+        super().__init__(driver, neo4j_database)
+        self.vector_index_name = vector_index_name
+        self.fulltext_index_name = fulltext_index_name
+        self.retrieval_query = retrieval_query
+        self.embedder = embedder
+        self.result_formatter = result_formatter
+        self._param_template = {
+            "vector_index_name": self.vector_index_name,
+            "fulltext_index_name": self.fulltext_index_name,
+        }
         self._node_label = None
         self._embedding_node_property = None
         self._embedding_dimension = None
@@ -418,9 +742,8 @@ class HybridCypherRetriever(Retriever):
         except ValidationError as e:
             raise SearchValidationError(e.errors()) from e
 
-        parameters = validated_data.model_dump(exclude_none=True)
-        parameters["vector_index_name"] = self.vector_index_name
-        parameters["fulltext_index_name"] = self.fulltext_index_name
+        parameters = self._param_template.copy()
+        parameters.update(validated_data.model_dump(exclude_none=True))
 
         if query_text and not query_vector:
             if not self.embedder:
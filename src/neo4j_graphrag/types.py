@@ -23,6 +23,7 @@ import neo4j
 from pydantic import (
     BaseModel,
     ConfigDict,
+    NonNegativeInt,
     PositiveInt,
     field_validator,
     model_validator,
@@ -189,6 +190,12 @@ class HybridSearchModel(BaseModel):
         return self
 
 
+class HybridSearchManyModel(BaseModel):
+    query_texts: list[str]
+    top_k: PositiveInt = 5
+    effective_search_ratio: PositiveInt = 1
+
+
 class HybridCypherSearchModel(HybridSearchModel):
     query_params: Optional[dict[str, Any]] = None
 
@@ -276,6 +283,8 @@ class HybridRetrieverModel(BaseModel):
     return_properties: Optional[list[str]] = None
     result_formatter: Optional[Callable[[neo4j.Record], RetrieverResultItem]] = None
     neo4j_database: Optional[str] = None
+    embedding_cache_size: NonNegativeInt = 0
+    quantize: Literal["none", "int8"] = "none"
 
 
 class HybridCypherRetrieverModel(BaseModel):
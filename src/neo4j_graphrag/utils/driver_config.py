@@ -15,8 +15,21 @@
 import neo4j
 from neo4j_graphrag import __version__
 
+# The version string never changes at runtime, so format it once at import
+_USER_AGENT = f"neo4j-graphrag-python/v{__version__}"
+
+
+def user_agent() -> str:
+    """Return the user agent string identifying this package. Pass it to
+    `GraphDatabase.driver(..., user_agent=user_agent())` to set it through
+    the public driver API at construction time.
+    """
+    return _USER_AGENT
+
 
 # Override user-agent used by neo4j package so we can measure usage of the package by version
 def override_user_agent(driver: neo4j.Driver) -> neo4j.Driver:
-    driver._pool.pool_config.user_agent = f"neo4j-graphrag-python/v{__version__}"
+    # Legacy path for drivers created without `user_agent`: mutates the
+    # driver's private pool config after the fact
+    driver._pool.pool_config.user_agent = _USER_AGENT
     return driver
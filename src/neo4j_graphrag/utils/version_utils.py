@@ -128,6 +128,22 @@ def has_metadata_filtering_support(
     return version_tuple >= target_version
 
 
+def has_vector_type_support(version_tuple: tuple[int, ...]) -> bool:
+    """
+    Checks if a Neo4j database supports the vector value type, sent over the
+    wire as the native Bolt Vector type by driver 6.x instead of a list of
+    boxed floats.
+
+    Args:
+        version_tuple (tuple[int, ...]): A tuple of integers representing the database version
+            (major, minor, patch) or (year, month, patch) for later versions.
+
+    Returns:
+        bool: True if the connected Neo4j database version supports the vector value type, False otherwise.
+    """
+    return version_tuple >= (2025, 6, 0)
+
+
 def get_version_cached(
     driver: neo4j.Driver, database: Optional[str] = None
 ) -> tuple[tuple[int, ...], bool, bool]:
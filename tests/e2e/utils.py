@@ -418,19 +418,15 @@ def populate_neo4j(
     neo4j_objs: dict[str, Any],
     should_create_vector_index: bool = False,
 ) -> neo4j.EagerResult:
-    question_nodes = list(
-        filter(lambda x: x["label"] == "Question", neo4j_objs["nodes"])
-    )
-    answer_nodes = list(filter(lambda x: x["label"] == "Answer", neo4j_objs["nodes"]))
-    category_nodes = list(
-        filter(lambda x: x["label"] == "Category", neo4j_objs["nodes"])
-    )
-    belongs_to_relationships = list(
-        filter(lambda x: x["type"] == "BELONGS_TO", neo4j_objs["relationships"])
-    )
-    has_answer_relationships = list(
-        filter(lambda x: x["type"] == "HAS_ANSWER", neo4j_objs["relationships"])
-    )
+    question_nodes = [x for x in neo4j_objs["nodes"] if x["label"] == "Question"]
+    answer_nodes = [x for x in neo4j_objs["nodes"] if x["label"] == "Answer"]
+    category_nodes = [x for x in neo4j_objs["nodes"] if x["label"] == "Category"]
+    belongs_to_relationships = [
+        x for x in neo4j_objs["relationships"] if x["type"] == "BELONGS_TO"
+    ]
+    has_answer_relationships = [
+        x for x in neo4j_objs["relationships"] if x["type"] == "HAS_ANSWER"
+    ]
     question_nodes_cypher = "UNWIND $nodes as node MERGE (n:Question {id: node.properties.id}) ON CREATE SET n = node.properties"
     answer_nodes_cypher = "UNWIND $nodes as node MERGE (n:Answer {id: node.properties.id}) ON CREATE SET n = node.properties"
     category_nodes_cypher = (
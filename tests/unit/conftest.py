@@ -27,7 +27,25 @@ from neo4j_graphrag.retrievers import (
     VectorCypherRetriever,
     VectorRetriever,
 )
-from neo4j_graphrag.types import RetrieverResultItem
+from neo4j_graphrag.neo4j_queries import get_search_query
+from neo4j_graphrag.types import RetrieverResultItem, SearchType
+
+
+@pytest.fixture(scope="session")
+def vector_search_query() -> str:
+    # compiled once per session: the plain vector query string is identical
+    # for every test that asserts on it
+    search_query, _ = get_search_query(SearchType.VECTOR)
+    return search_query
+
+
+@pytest.fixture(scope="session")
+def hybrid_search_query() -> str:
+    # same for the plain hybrid query on a 5.23+ server
+    search_query, _ = get_search_query(
+        SearchType.HYBRID, neo4j_version_is_5_23_or_above=True
+    )
+    return search_query
 
 
 @pytest.fixture(scope="function")
@@ -53,14 +71,14 @@ def retriever_mock() -> MagicMock:
 
 
 @pytest.fixture(scope="function")
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def vector_retriever(mock_get_version: MagicMock, driver: MagicMock) -> VectorRetriever:
     mock_get_version.return_value = ((5, 23, 0), False, False)
     return VectorRetriever(driver, "my-index")
 
 
 @pytest.fixture(scope="function")
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def vector_cypher_retriever(
     mock_get_version: MagicMock, driver: MagicMock
 ) -> VectorCypherRetriever:
@@ -70,14 +88,14 @@ def vector_cypher_retriever(
 
 
 @pytest.fixture(scope="function")
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def hybrid_retriever(mock_get_version: MagicMock, driver: MagicMock) -> HybridRetriever:
     mock_get_version.return_value = ((5, 23, 0), False, False)
     return HybridRetriever(driver, "my-index", "my-fulltext-index")
 
 
 @pytest.fixture(scope="function")
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def t2c_retriever(
     mock_get_version: MagicMock, driver: MagicMock, llm: MagicMock
 ) -> Text2CypherRetriever:
@@ -26,23 +26,49 @@ from neo4j_graphrag.types import LLMMessage
 from pydantic import BaseModel, ConfigDict
 
 
-@pytest.fixture
+# Module scope: MagicMock construction is slow, build the mocked cohere
+# module once and reset it between tests instead of rebuilding it per test
+@pytest.fixture(scope="module")
 def mock_cohere() -> Generator[MagicMock, None, None]:
-    mock_cohere = MagicMock()
+    # spec_set narrows the mock to the attributes CohereLLM actually uses,
+    # so accessing anything else fails fast instead of materializing a new
+    # child mock
+    mock_cohere = MagicMock(
+        spec_set=[
+            "ClientV2",
+            "AsyncClientV2",
+            "core",
+            "SystemChatMessageV2",
+            "UserChatMessageV2",
+            "AssistantChatMessageV2",
+        ]
+    )
     mock_cohere.core.api_error.ApiError = cohere.core.ApiError
     with patch.dict(sys.modules, {"cohere": mock_cohere}):
         yield mock_cohere
 
 
+@pytest.fixture(autouse=True)
+def reset_mock_cohere(mock_cohere: MagicMock) -> None:
+    # function-scoped reset so per-test call assertions on the shared mock
+    # keep working
+    mock_cohere.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def chat_response_mock() -> MagicMock:
+    chat_response_mock = MagicMock()
+    chat_response_mock.message.content = [MagicMock(text="cohere response text")]
+    return chat_response_mock
+
+
 @patch("builtins.__import__", side_effect=ImportError)
 def test_cohere_llm_missing_dependency(mock_import: Mock) -> None:
     with pytest.raises(ImportError):
         CohereLLM(model_name="something")
 
 
-def test_cohere_llm_happy_path(mock_cohere: Mock) -> None:
-    chat_response_mock = MagicMock()
-    chat_response_mock.message.content = [MagicMock(text="cohere response text")]
+def test_cohere_llm_happy_path(mock_cohere: Mock, chat_response_mock: MagicMock) -> None:
     mock_cohere.ClientV2.return_value.chat.return_value = chat_response_mock
     llm = CohereLLM(model_name="something")
     res = llm.invoke("my text")
@@ -50,9 +76,9 @@ def test_cohere_llm_happy_path(mock_cohere: Mock) -> None:
     assert res.content == "cohere response text"
 
 
-def test_cohere_llm_invoke_with_message_history_happy_path(mock_cohere: Mock) -> None:
-    chat_response_mock = MagicMock()
-    chat_response_mock.message.content = [MagicMock(text="cohere response text")]
+def test_cohere_llm_invoke_with_message_history_happy_path(
+    mock_cohere: Mock, chat_response_mock: MagicMock
+) -> None:
     mock_cohere_client_chat = mock_cohere.ClientV2.return_value.chat
     mock_cohere_client_chat.return_value = chat_response_mock
 
@@ -77,10 +103,8 @@ def test_cohere_llm_invoke_with_message_history_happy_path(mock_cohere: Mock) ->
 
 
 def test_cohere_llm_invoke_with_message_history_and_system_instruction(
-    mock_cohere: Mock,
+    mock_cohere: Mock, chat_response_mock: MagicMock
 ) -> None:
-    chat_response_mock = MagicMock()
-    chat_response_mock.message.content = [MagicMock(text="cohere response text")]
     mock_cohere_client_chat = mock_cohere.ClientV2.return_value.chat
     mock_cohere_client_chat.return_value = chat_response_mock
 
@@ -105,10 +129,8 @@ def test_cohere_llm_invoke_with_message_history_and_system_instruction(
 
 
 def test_cohere_llm_invoke_with_message_history_validation_error(
-    mock_cohere: Mock,
+    mock_cohere: Mock, chat_response_mock: MagicMock
 ) -> None:
-    chat_response_mock = MagicMock()
-    chat_response_mock.message.content = [MagicMock(text="cohere response text")]
     mock_cohere.ClientV2.return_value.chat.return_value = chat_response_mock
 
     system_instruction = "You are a helpful assistant."
@@ -125,10 +147,9 @@ def test_cohere_llm_invoke_with_message_history_validation_error(
 
 
 @pytest.mark.asyncio
-async def test_cohere_llm_happy_path_async(mock_cohere: Mock) -> None:
-    chat_response_mock = MagicMock(
-        message=MagicMock(content=[MagicMock(text="cohere response text")])
-    )
+async def test_cohere_llm_happy_path_async(
+    mock_cohere: Mock, chat_response_mock: MagicMock
+) -> None:
     mock_cohere.AsyncClientV2.return_value.chat = AsyncMock(
         return_value=chat_response_mock
     )
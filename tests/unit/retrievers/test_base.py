@@ -36,7 +36,7 @@ from neo4j_graphrag.types import RawSearchResult, RetrieverResult
         (((2025, 1, 0), True, True), None),
     ],
 )
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_retriever_version_support(
     mock_get_version: MagicMock,
     driver: MagicMock,
@@ -56,7 +56,7 @@ def test_retriever_version_support(
         MockRetriever(driver=driver)
 
 
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_retriever_search_docstring_copied(
     mock_get_version: MagicMock,
     driver: MagicMock,
@@ -81,7 +81,7 @@ def test_retriever_search_docstring_copied(
     assert top_k_param.annotation == "int"
 
 
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_retriever_search_docstring_unchanged(
     mock_get_version: MagicMock,
     driver: MagicMock,
@@ -13,10 +13,13 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from typing import Any, Generator, Optional
 from unittest.mock import MagicMock, patch
 
 import neo4j
+import numpy as np
 import pytest
+from neo4j_graphrag.embeddings.base import Embedder
 from neo4j_graphrag.exceptions import (
     EmbeddingRequiredError,
     RetrieverInitializationError,
@@ -32,9 +35,112 @@ from neo4j_graphrag.types import (
     HybridSearchRanker,
 )
 
+# Build the 1536-dim test vectors once at module level instead of
+# re-allocating 1536 floats with a comprehension in every test
+_EMBED_QUERY_VECTOR = np.ones(1536, dtype=np.float32).tolist()
+_QUERY_VECTOR = (np.ones(1536, dtype=np.float32) * 2.0).tolist()
+
+
+class FakeEmbedder:
+    """Lightweight embedder double. MagicMock's generic machinery is
+    overkill for most tests here, which only need a canned vector and a
+    record of the texts that were embedded.
+    """
+
+    def __init__(self, vector: list[float]) -> None:
+        self.vector = vector
+        self.calls: list[str] = []
+
+    def embed_query(self, text: str) -> list[float]:
+        self.calls.append(text)
+        return self.vector
+
+    async def async_embed_query(self, text: str) -> list[float]:
+        self.calls.append(text)
+        return self.vector
+
+
+@pytest.fixture
+def fake_embedder() -> FakeEmbedder:
+    return FakeEmbedder(_EMBED_QUERY_VECTOR)
+
+
+def _assert_hybrid_query_call(
+    driver: MagicMock,
+    expected_query: str,
+    query_text: str,
+    query_vector: list[float],
+    top_k: int = 5,
+    effective_search_ratio: int = 1,
+    database: Optional[str] = None,
+    extra_params: Optional[dict[str, Any]] = None,
+    vector_index_name: str = "vector-index",
+    fulltext_index_name: str = "fulltext-index",
+) -> None:
+    """Assert the driver ran exactly one hybrid query with the standard
+    parameter map. extra_params extends the map for the query_params and
+    ranker variants.
+    """
+    parameters = {
+        "vector_index_name": vector_index_name,
+        "top_k": top_k,
+        "effective_search_ratio": effective_search_ratio,
+        "query_text": query_text,
+        "fulltext_index_name": fulltext_index_name,
+        "query_vector": query_vector,
+    }
+    if extra_params:
+        parameters.update(extra_params)
+    driver.execute_query.assert_called_once_with(
+        expected_query,
+        parameters,
+        database_=database,
+        routing_=neo4j.RoutingControl.READ,
+    )
+
+
+@pytest.fixture(autouse=True, scope="module")
+def mock_get_version() -> Generator[MagicMock, None, None]:
+    """Patch the server version probe once for the whole module instead of
+    installing and tearing down a patch in every test. Tests that need a
+    different version or per-test call assertions install their own patch
+    on top of this one.
+    """
+    with patch("neo4j_graphrag.retrievers.base.get_version_cached") as mock:
+        mock.return_value = ((5, 23, 0), False, False)
+        yield mock
+
+
+@pytest.fixture
+def ready_hybrid_retriever(
+    driver: MagicMock, fake_embedder: FakeEmbedder, neo4j_record: MagicMock
+) -> Generator[HybridRetriever, None, None]:
+    """A HybridRetriever wired to the mocked driver and a FakeEmbedder, with
+    the index-info fetch and SEARCH-clause probe patched out for the duration
+    of the test. The version check is patched by the module-level
+    mock_get_version fixture.
+    """
+    with (
+        patch(
+            "neo4j_graphrag.retrievers.hybrid.supports_search_clause",
+            return_value=False,
+        ),
+        patch("neo4j_graphrag.retrievers.HybridRetriever._fetch_index_infos"),
+    ):
+        retriever = HybridRetriever(
+            driver, "vector-index", "fulltext-index", fake_embedder
+        )
+        retriever.neo4j_version_is_5_23_or_above = True
+        driver.execute_query.return_value = [
+            [neo4j_record],
+            None,
+            None,
+        ]
+        yield retriever
+
 
 def test_vector_retriever_initialization(driver: MagicMock) -> None:
-    with patch("neo4j_graphrag.retrievers.base.get_version") as mock_get_version:
+    with patch("neo4j_graphrag.retrievers.base.get_version_cached") as mock_get_version:
         mock_get_version.return_value = ((5, 23, 0), False, False)
         HybridRetriever(
             driver=driver,
@@ -45,7 +151,7 @@ def test_vector_retriever_initialization(driver: MagicMock) -> None:
 
 
 def test_vector_cypher_retriever_initialization(driver: MagicMock) -> None:
-    with patch("neo4j_graphrag.retrievers.base.get_version") as mock_get_version:
+    with patch("neo4j_graphrag.retrievers.base.get_version_cached") as mock_get_version:
         mock_get_version.return_value = ((5, 23, 0), False, False)
         HybridCypherRetriever(
             driver=driver,
@@ -56,11 +162,9 @@ def test_vector_cypher_retriever_initialization(driver: MagicMock) -> None:
         mock_get_version.assert_called_once()
 
 
-@patch("neo4j_graphrag.retrievers.base.get_version")
 def test_hybrid_retriever_invalid_fulltext_index_name(
-    mock_get_version: MagicMock, driver: MagicMock
+    driver: MagicMock
 ) -> None:
-    mock_get_version.return_value = ((5, 23, 0), False, False)
     with pytest.raises(RetrieverInitializationError) as exc_info:
         HybridRetriever(
             driver=driver,
@@ -73,17 +177,14 @@ def test_hybrid_retriever_invalid_fulltext_index_name(
 
 
 @patch("neo4j_graphrag.retrievers.hybrid.supports_search_clause", return_value=False)
-@patch("neo4j_graphrag.retrievers.base.get_version")
 def test_hybrid_retriever_with_result_format_function(
-    mock_get_version: MagicMock,
     _mock_search_clause: MagicMock,
     driver: MagicMock,
     embedder: MagicMock,
     neo4j_record: MagicMock,
     result_formatter: MagicMock,
 ) -> None:
-    mock_get_version.return_value = ((5, 23, 0), False, False)
-    embed_query_vector = [1.0 for _ in range(1536)]
+    embed_query_vector = _EMBED_QUERY_VECTOR
     embedder.embed_query.return_value = embed_query_vector
     vector_index_name = "vector-index"
     fulltext_index_name = "fulltext-index"
@@ -116,11 +217,9 @@ def test_hybrid_retriever_with_result_format_function(
     )
 
 
-@patch("neo4j_graphrag.retrievers.base.get_version")
 def test_hybrid_retriever_invalid_database_name(
-    mock_get_version: MagicMock, driver: MagicMock
+    driver: MagicMock
 ) -> None:
-    mock_get_version.return_value = ((5, 23, 0), False, False)
     with pytest.raises(RetrieverInitializationError) as exc_info:
         HybridRetriever(
             driver=driver,
@@ -133,11 +232,9 @@ def test_hybrid_retriever_invalid_database_name(
     assert "Input should be a valid string" in str(exc_info.value)
 
 
-@patch("neo4j_graphrag.retrievers.base.get_version")
 def test_hybrid_cypher_retriever_invalid_retrieval_query(
-    mock_get_version: MagicMock, driver: MagicMock
+    driver: MagicMock
 ) -> None:
-    mock_get_version.return_value = ((5, 23, 0), False, False)
     with pytest.raises(RetrieverInitializationError) as exc_info:
         HybridCypherRetriever(
             driver=driver,
@@ -150,11 +247,9 @@ def test_hybrid_cypher_retriever_invalid_retrieval_query(
     assert "Input should be a valid string" in str(exc_info.value)
 
 
-@patch("neo4j_graphrag.retrievers.base.get_version")
 def test_hybrid_cypher_retriever_invalid_database_name(
-    mock_get_version: MagicMock, driver: MagicMock
+    driver: MagicMock
 ) -> None:
-    mock_get_version.return_value = ((5, 23, 0), False, False)
     retrieval_query = """
         RETURN node.id AS node_id, node.text AS text, score, {test: $param} AS metadata
         """
@@ -171,38 +266,19 @@ def test_hybrid_cypher_retriever_invalid_database_name(
     assert "Input should be a valid string" in str(exc_info.value)
 
 
-@patch("neo4j_graphrag.retrievers.hybrid.supports_search_clause", return_value=False)
-@patch("neo4j_graphrag.retrievers.HybridRetriever._fetch_index_infos")
-@patch("neo4j_graphrag.retrievers.base.get_version")
 def test_hybrid_search_text_happy_path(
-    mock_get_version: MagicMock,
-    _fetch_index_infos_mock: MagicMock,
-    _mock_search_clause: MagicMock,
-    driver: MagicMock,
-    embedder: MagicMock,
-    neo4j_record: MagicMock,
+    ready_hybrid_retriever: HybridRetriever,
+    fake_embedder: FakeEmbedder,
 ) -> None:
-    mock_get_version.return_value = ((5, 23, 0), False, False)
-    embed_query_vector = [1.0 for _ in range(1536)]
-    embedder.embed_query.return_value = embed_query_vector
-    vector_index_name = "vector-index"
-    fulltext_index_name = "fulltext-index"
+    embed_query_vector = _EMBED_QUERY_VECTOR
     query_text = "may thy knife chip and shatter"
     top_k = 5
     effective_search_ratio = 2
 
-    retriever = HybridRetriever(
-        driver, vector_index_name, fulltext_index_name, embedder
-    )
-    retriever.neo4j_version_is_5_23_or_above = True
+    retriever = ready_hybrid_retriever
     retriever._embedding_node_property = (
         "embedding"  # variable normally filled by fetch_index_infos
     )
-    retriever.driver.execute_query.return_value = [  # type: ignore
-        [neo4j_record],
-        None,
-        None,
-    ]
     search_query, _ = get_search_query(
         SearchType.HYBRID,
         embedding_node_property="embedding",
@@ -215,20 +291,15 @@ def test_hybrid_search_text_happy_path(
         effective_search_ratio=effective_search_ratio,
     )
 
-    retriever.driver.execute_query.assert_called_once_with(  # type: ignore
+    _assert_hybrid_query_call(
+        retriever.driver,
         search_query,
-        {
-            "vector_index_name": vector_index_name,
-            "top_k": top_k,
-            "effective_search_ratio": effective_search_ratio,
-            "query_text": query_text,
-            "fulltext_index_name": fulltext_index_name,
-            "query_vector": embed_query_vector,
-        },
-        database_=None,
-        routing_=neo4j.RoutingControl.READ,
+        query_text=query_text,
+        query_vector=embed_query_vector,
+        top_k=top_k,
+        effective_search_ratio=effective_search_ratio,
     )
-    embedder.embed_query.assert_called_once_with(query_text)
+    assert fake_embedder.calls == [query_text]
     assert records == RetrieverResult(
         items=[
             RetrieverResultItem(content="dummy-node", metadata={"score": 1.0}),
@@ -239,25 +310,23 @@ def test_hybrid_search_text_happy_path(
 
 @patch("neo4j_graphrag.retrievers.hybrid.supports_search_clause", return_value=False)
 @patch("neo4j_graphrag.retrievers.HybridRetriever._fetch_index_infos")
-@patch("neo4j_graphrag.retrievers.base.get_version")
-def test_hybrid_search_sanitizes_text(
-    mock_get_version: MagicMock,
+def test_hybrid_search_embedding_cache(
     _fetch_index_infos_mock: MagicMock,
     _mock_search_clause: MagicMock,
     driver: MagicMock,
     embedder: MagicMock,
     neo4j_record: MagicMock,
 ) -> None:
-    mock_get_version.return_value = ((5, 23, 0), False, False)
-    embed_query_vector = [1.0 for _ in range(1536)]
+    embed_query_vector = _EMBED_QUERY_VECTOR
     embedder.embed_query.return_value = embed_query_vector
-    vector_index_name = "vector-index"
-    fulltext_index_name = "fulltext-index"
-    query_text = 'may thy knife chip and shatter+-&|!(){}[]^"~*?:\\/'
-    top_k = 5
-    effective_search_ratio = 2
+    query_text = "may thy knife chip and shatter"
+
     retriever = HybridRetriever(
-        driver, vector_index_name, fulltext_index_name, embedder
+        driver,
+        "vector-index",
+        "fulltext-index",
+        embedder,
+        embedding_cache_size=2,
     )
     retriever.neo4j_version_is_5_23_or_above = True
     retriever.driver.execute_query.return_value = [  # type: ignore
@@ -265,35 +334,24 @@ def test_hybrid_search_sanitizes_text(
         None,
         None,
     ]
-    retriever.search(
-        query_text=query_text,
-        top_k=top_k,
-        effective_search_ratio=effective_search_ratio,
-    )
+
+    retriever.search(query_text=query_text)
+    records = retriever.search(query_text=query_text)
+
+    # the second identical search reuses the cached vector
     embedder.embed_query.assert_called_once_with(query_text)
-    search_query, _ = get_search_query(
-        SearchType.HYBRID,
-        neo4j_version_is_5_23_or_above=retriever.neo4j_version_is_5_23_or_above,
-    )
-    driver.execute_query.assert_called_once_with(
-        search_query,
-        {
-            "vector_index_name": vector_index_name,
-            "top_k": top_k,
-            "effective_search_ratio": effective_search_ratio,
-            "query_text": query_text,
-            "fulltext_index_name": fulltext_index_name,
-            "query_vector": embed_query_vector,
-        },
-        database_=None,
-        routing_=neo4j.RoutingControl.READ,
-    )
+    assert records.metadata is not None
+    assert records.metadata["query_vector"] == embed_query_vector
+
+    # a different query text is embedded as usual
+    retriever.search(query_text="another question")
+    assert embedder.embed_query.call_count == 2
 
 
 @patch("neo4j_graphrag.retrievers.hybrid.supports_search_clause", return_value=False)
 @patch("neo4j_graphrag.retrievers.HybridRetriever._fetch_index_infos")
-@patch("neo4j_graphrag.retrievers.base.get_version")
-def test_hybrid_search_favors_query_vector_over_embedding_vector(
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
+def test_hybrid_search_sends_bolt_vector_when_supported(
     mock_get_version: MagicMock,
     _fetch_index_infos_mock: MagicMock,
     _mock_search_clause: MagicMock,
@@ -301,35 +359,250 @@ def test_hybrid_search_favors_query_vector_over_embedding_vector(
     embedder: MagicMock,
     neo4j_record: MagicMock,
 ) -> None:
-    mock_get_version.return_value = ((5, 23, 0), False, False)
-    embed_query_vector = [1.0 for _ in range(1536)]
-    query_vector = [2.0 for _ in range(1536)]
+    vector_module = pytest.importorskip("neo4j.vector")
+    mock_get_version.return_value = ((2025, 6, 0), False, False)
+    embedder.embed_query.return_value = [1.0, 2.0, 3.0]
+
+    retriever = HybridRetriever(driver, "vector-index", "fulltext-index", embedder)
+    driver.execute_query.return_value = [
+        [neo4j_record],
+        None,
+        None,
+    ]
+
+    records = retriever.search(query_text="may thy knife chip and shatter")
+
+    parameters = driver.execute_query.call_args[0][1]
+    assert isinstance(parameters["query_vector"], vector_module.Vector)
+    assert parameters["query_vector"].to_native() == [1.0, 2.0, 3.0]
+    # metadata keeps the plain list
+    assert records.metadata is not None
+    assert records.metadata["query_vector"] == [1.0, 2.0, 3.0]
+
+
+@patch("neo4j_graphrag.retrievers.hybrid.supports_search_clause", return_value=False)
+@patch("neo4j_graphrag.retrievers.HybridRetriever._fetch_index_infos")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
+def test_hybrid_search_quantizes_vector_to_int8_when_enabled(
+    mock_get_version: MagicMock,
+    _fetch_index_infos_mock: MagicMock,
+    _mock_search_clause: MagicMock,
+    driver: MagicMock,
+    embedder: MagicMock,
+    neo4j_record: MagicMock,
+) -> None:
+    vector_module = pytest.importorskip("neo4j.vector")
+    mock_get_version.return_value = ((2025, 6, 0), False, False)
+    embedder.embed_query.return_value = [0.5, -1.0, 1.0]
 
-    embedder.embed_query.return_value = embed_query_vector
-    vector_index_name = "vector-index"
-    fulltext_index_name = "fulltext-index"
-    query_text = "may thy knife chip and shatter"
-    top_k = 5
-    effective_search_ratio = 2
-    database = "neo4j"
     retriever = HybridRetriever(
-        driver,
-        vector_index_name,
-        fulltext_index_name,
-        embedder,
-        neo4j_database=database,
+        driver, "vector-index", "fulltext-index", embedder, quantize="int8"
     )
-    retriever.neo4j_version_is_5_23_or_above = True
-    retriever.driver.execute_query.return_value = [  # type: ignore
+    driver.execute_query.return_value = [
         [neo4j_record],
         None,
         None,
     ]
-    search_query, _ = get_search_query(
-        SearchType.HYBRID,
-        neo4j_version_is_5_23_or_above=retriever.neo4j_version_is_5_23_or_above,
+
+    records = retriever.search(query_text="may thy knife chip and shatter")
+
+    parameters = driver.execute_query.call_args[0][1]
+    assert isinstance(parameters["query_vector"], vector_module.Vector)
+    assert parameters["query_vector"].to_native() == [64, -127, 127]
+    assert parameters["query_vector_scale"] == 1.0
+    # metadata keeps the full precision list
+    assert records.metadata is not None
+    assert records.metadata["query_vector"] == [0.5, -1.0, 1.0]
+
+
+def test_hybrid_search_many_single_driver_call(
+    ready_hybrid_retriever: HybridRetriever,
+    driver: MagicMock,
+    fake_embedder: FakeEmbedder,
+) -> None:
+    query_texts = [f"may thy knife chip and shatter {i}" for i in range(10)]
+    driver.execute_query.return_value = [
+        [
+            neo4j.Record({"query_index": i, "node": "dummy-node", "score": 1.0})
+            for i in range(10)
+        ],
+        None,
+        None,
+    ]
+
+    results = ready_hybrid_retriever.search_many(query_texts, top_k=5)
+
+    # ten searches go through a single driver round trip
+    driver.execute_query.assert_called_once()
+    assert fake_embedder.calls == query_texts
+    assert len(results) == 10
+    for result in results:
+        assert isinstance(result, RetrieverResult)
+        assert result.items == [
+            RetrieverResultItem(content="dummy-node", metadata={"score": 1.0}),
+        ]
+
+
+def test_hybrid_search_many_invalid_query_texts(
+    ready_hybrid_retriever: HybridRetriever,
+) -> None:
+    with pytest.raises(SearchValidationError) as exc_info:
+        ready_hybrid_retriever.search_many(query_texts=42)  # type: ignore
+
+    assert "query_texts" in str(exc_info.value)
+
+
+def test_hybrid_search_stream_yields_items_lazily(
+    ready_hybrid_retriever: HybridRetriever,
+) -> None:
+    items = ready_hybrid_retriever.search_stream(
+        query_text="may thy knife chip and shatter"
+    )
+
+    # items come back as a lazy iterator, not a materialized list
+    assert not isinstance(items, list)
+    assert list(items) == [
+        RetrieverResultItem(content="dummy-node", metadata={"score": 1.0}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_async_embeds_through_async_api(
+    ready_hybrid_retriever: HybridRetriever,
+    fake_embedder: FakeEmbedder,
+) -> None:
+    query_text = "may thy knife chip and shatter"
+
+    result = await ready_hybrid_retriever.search_async(query_text=query_text)
+
+    # embedded exactly once, via async_embed_query
+    assert fake_embedder.calls == [query_text]
+    assert result == RetrieverResult(
+        items=[
+            RetrieverResultItem(content="dummy-node", metadata={"score": 1.0}),
+        ],
+        metadata={
+            "__retriever": "HybridRetriever",
+            "query_vector": _EMBED_QUERY_VECTOR,
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_async_sync_only_embedder_embeds_off_loop(
+    ready_hybrid_retriever: HybridRetriever,
+) -> None:
+    class SyncOnlyEmbedder(Embedder):
+        """Embedder that inherits the base class's blocking async default."""
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.calls: list[str] = []
+
+        def embed_query(self, text: str) -> list[float]:
+            self.calls.append(text)
+            return _EMBED_QUERY_VECTOR
+
+    embedder = SyncOnlyEmbedder()
+    ready_hybrid_retriever.embedder = embedder
+    query_text = "may thy knife chip and shatter"
+
+    result = await ready_hybrid_retriever.search_async(query_text=query_text)
+
+    # no async override: embedding happens once, inside the worker thread
+    assert embedder.calls == [query_text]
+    assert result.metadata is not None
+    assert result.metadata["query_vector"] == _EMBED_QUERY_VECTOR
+
+
+def test_hybrid_search_scope_reuses_single_session(
+    ready_hybrid_retriever: HybridRetriever,
+    driver: MagicMock,
+    neo4j_record: MagicMock,
+) -> None:
+    session = driver.session.return_value.__enter__.return_value
+    session.run.return_value = [neo4j_record]
+
+    with ready_hybrid_retriever.search_scope() as scoped_search:
+        for _ in range(3):
+            result = scoped_search(query_text="may thy knife chip and shatter")
+
+    # one read session acquisition for all three searches, none per call
+    driver.session.assert_called_once_with(
+        database=None, default_access_mode=neo4j.READ_ACCESS
+    )
+    assert session.run.call_count == 3
+    driver.execute_query.assert_not_called()
+    assert result.items == [
+        RetrieverResultItem(content="dummy-node", metadata={"score": 1.0}),
+    ]
+    # searches outside the scope go back to per-call sessions
+    ready_hybrid_retriever.search(query_text="may thy knife chip and shatter")
+    driver.execute_query.assert_called_once()
+
+
+def test_hybrid_search_param_template_not_mutated(
+    ready_hybrid_retriever: HybridRetriever,
+) -> None:
+    template_before = dict(ready_hybrid_retriever._param_template)
+
+    ready_hybrid_retriever.search(query_text="may thy knife chip and shatter")
+
+    # per-search parameters are merged into a copy, not the shared template
+    assert ready_hybrid_retriever._param_template == template_before
+
+
+def test_hybrid_search_embedding_cache_disabled_by_default(
+    ready_hybrid_retriever: HybridRetriever,
+    fake_embedder: FakeEmbedder,
+) -> None:
+    query_text = "may thy knife chip and shatter"
+
+    ready_hybrid_retriever.search(query_text=query_text)
+    ready_hybrid_retriever.search(query_text=query_text)
+
+    assert fake_embedder.calls == [query_text, query_text]
+
+
+def test_hybrid_search_sanitizes_text(
+    ready_hybrid_retriever: HybridRetriever,
+    driver: MagicMock,
+    fake_embedder: FakeEmbedder,
+    hybrid_search_query: str,
+) -> None:
+    embed_query_vector = _EMBED_QUERY_VECTOR
+    query_text = 'may thy knife chip and shatter+-&|!(){}[]^"~*?:\\/'
+    top_k = 5
+    effective_search_ratio = 2
+    ready_hybrid_retriever.search(
+        query_text=query_text,
+        top_k=top_k,
+        effective_search_ratio=effective_search_ratio,
+    )
+    assert fake_embedder.calls == [query_text]
+    _assert_hybrid_query_call(
+        driver,
+        hybrid_search_query,
+        query_text=query_text,
+        query_vector=embed_query_vector,
+        top_k=top_k,
+        effective_search_ratio=effective_search_ratio,
     )
 
+
+def test_hybrid_search_favors_query_vector_over_embedding_vector(
+    ready_hybrid_retriever: HybridRetriever,
+    fake_embedder: FakeEmbedder,
+    hybrid_search_query: str,
+) -> None:
+    query_vector = _QUERY_VECTOR
+    query_text = "may thy knife chip and shatter"
+    top_k = 5
+    effective_search_ratio = 2
+    database = "neo4j"
+    retriever = ready_hybrid_retriever
+    retriever.neo4j_database = database
+
     retriever.search(
         query_text=query_text,
         query_vector=query_vector,
@@ -337,20 +610,16 @@ def test_hybrid_search_favors_query_vector_over_embedding_vector(
         effective_search_ratio=effective_search_ratio,
     )
 
-    retriever.driver.execute_query.assert_called_once_with(  # type: ignore
-        search_query,
-        {
-            "vector_index_name": vector_index_name,
-            "top_k": top_k,
-            "effective_search_ratio": effective_search_ratio,
-            "query_text": query_text,
-            "fulltext_index_name": fulltext_index_name,
-            "query_vector": query_vector,
-        },
-        database_=database,
-        routing_=neo4j.RoutingControl.READ,
+    _assert_hybrid_query_call(
+        retriever.driver,  # type: ignore
+        hybrid_search_query,
+        query_text=query_text,
+        query_vector=query_vector,
+        top_k=top_k,
+        effective_search_ratio=effective_search_ratio,
+        database=database,
     )
-    embedder.embed_query.assert_not_called()
+    assert fake_embedder.calls == []
 
 
 def test_error_when_hybrid_search_only_text_no_embedder(
@@ -385,17 +654,14 @@ def test_hybrid_search_retriever_search_missing_embedder_for_text(
 
 @patch("neo4j_graphrag.retrievers.hybrid.supports_search_clause", return_value=False)
 @patch("neo4j_graphrag.retrievers.HybridRetriever._fetch_index_infos")
-@patch("neo4j_graphrag.retrievers.base.get_version")
 def test_hybrid_retriever_return_properties(
-    mock_get_version: MagicMock,
     _fetch_index_infos_mock: MagicMock,
     _mock_search_clause: MagicMock,
     driver: MagicMock,
     embedder: MagicMock,
     neo4j_record: MagicMock,
 ) -> None:
-    mock_get_version.return_value = ((5, 23, 0), False, False)
-    embed_query_vector = [1.0 for _ in range(1536)]
+    embed_query_vector = _EMBED_QUERY_VECTOR
     embedder.embed_query.return_value = embed_query_vector
     vector_index_name = "vector-index"
     fulltext_index_name = "fulltext-index"
@@ -429,18 +695,15 @@ def test_hybrid_retriever_return_properties(
     )
 
     embedder.embed_query.assert_called_once_with(query_text)
-    driver.execute_query.assert_called_once_with(
+    _assert_hybrid_query_call(
+        driver,
         search_query,
-        {
-            "vector_index_name": vector_index_name,
-            "top_k": top_k,
-            "effective_search_ratio": effective_search_ratio,
-            "query_text": query_text,
-            "fulltext_index_name": fulltext_index_name,
-            "query_vector": embed_query_vector,
-        },
-        database_=None,
-        routing_=neo4j.RoutingControl.READ,
+        query_text=query_text,
+        query_vector=embed_query_vector,
+        top_k=top_k,
+        effective_search_ratio=effective_search_ratio,
+        vector_index_name=vector_index_name,
+        fulltext_index_name=fulltext_index_name,
     )
     assert records == RetrieverResult(
         items=[
@@ -452,17 +715,14 @@ def test_hybrid_retriever_return_properties(
 
 @patch("neo4j_graphrag.retrievers.hybrid.supports_search_clause", return_value=False)
 @patch("neo4j_graphrag.retrievers.HybridCypherRetriever._fetch_index_infos")
-@patch("neo4j_graphrag.retrievers.base.get_version")
 def test_hybrid_cypher_retrieval_query_with_params(
-    mock_get_version: MagicMock,
     _fetch_index_infos_mock: MagicMock,
     _mock_search_clause: MagicMock,
     driver: MagicMock,
     embedder: MagicMock,
     neo4j_record: MagicMock,
 ) -> None:
-    mock_get_version.return_value = ((5, 23, 0), False, False)
-    embed_query_vector = [1.0 for _ in range(1536)]
+    embed_query_vector = _EMBED_QUERY_VECTOR
     embedder.embed_query.return_value = embed_query_vector
     vector_index_name = "vector-index"
     fulltext_index_name = "fulltext-index"
@@ -503,19 +763,16 @@ def test_hybrid_cypher_retrieval_query_with_params(
 
     embedder.embed_query.assert_called_once_with(query_text)
 
-    driver.execute_query.assert_called_once_with(
+    _assert_hybrid_query_call(
+        driver,
         search_query,
-        {
-            "vector_index_name": vector_index_name,
-            "top_k": top_k,
-            "effective_search_ratio": effective_search_ratio,
-            "query_text": query_text,
-            "fulltext_index_name": fulltext_index_name,
-            "query_vector": embed_query_vector,
-            "param": "dummy-param",
-        },
-        database_=None,
-        routing_=neo4j.RoutingControl.READ,
+        query_text=query_text,
+        query_vector=embed_query_vector,
+        top_k=top_k,
+        effective_search_ratio=effective_search_ratio,
+        extra_params={"param": "dummy-param"},
+        vector_index_name=vector_index_name,
+        fulltext_index_name=fulltext_index_name,
     )
 
     assert records == RetrieverResult(
@@ -534,9 +791,7 @@ def test_hybrid_cypher_retrieval_query_with_params(
 
 @patch("neo4j_graphrag.retrievers.hybrid.supports_search_clause", return_value=False)
 @patch("neo4j_graphrag.retrievers.HybridCypherRetriever._fetch_index_infos")
-@patch("neo4j_graphrag.retrievers.base.get_version")
 def test_hybrid_cypher_retriever_with_result_format_function(
-    mock_get_version: MagicMock,
     _fetch_index_infos_mock: MagicMock,
     _mock_search_clause: MagicMock,
     driver: MagicMock,
@@ -544,8 +799,7 @@ def test_hybrid_cypher_retriever_with_result_format_function(
     neo4j_record: MagicMock,
     result_formatter: MagicMock,
 ) -> None:
-    mock_get_version.return_value = ((5, 23, 0), False, False)
-    embed_query_vector = [1.0 for _ in range(1536)]
+    embed_query_vector = _EMBED_QUERY_VECTOR
     embedder.embed_query.return_value = embed_query_vector
     vector_index_name = "vector-index"
     fulltext_index_name = "fulltext-index"
@@ -584,17 +838,14 @@ def test_hybrid_cypher_retriever_with_result_format_function(
 
 @patch("neo4j_graphrag.retrievers.hybrid.supports_search_clause", return_value=False)
 @patch("neo4j_graphrag.retrievers.HybridCypherRetriever._fetch_index_infos")
-@patch("neo4j_graphrag.retrievers.base.get_version")
 def test_hybrid_cypher_search_sanitizes_text(
-    mock_get_version: MagicMock,
     _fetch_index_infos_mock: MagicMock,
     _mock_search_clause: MagicMock,
     driver: MagicMock,
     embedder: MagicMock,
     neo4j_record: MagicMock,
 ) -> None:
-    mock_get_version.return_value = ((5, 23, 0), False, False)
-    embed_query_vector = [1.0 for _ in range(1536)]
+    embed_query_vector = _EMBED_QUERY_VECTOR
     embedder.embed_query.return_value = embed_query_vector
     vector_index_name = "vector-index"
     fulltext_index_name = "fulltext-index"
@@ -627,26 +878,21 @@ def test_hybrid_cypher_search_sanitizes_text(
         retrieval_query=retrieval_query,
         neo4j_version_is_5_23_or_above=retriever.neo4j_version_is_5_23_or_above,
     )
-    driver.execute_query.assert_called_once_with(
+    _assert_hybrid_query_call(
+        driver,
         search_query,
-        {
-            "vector_index_name": vector_index_name,
-            "top_k": top_k,
-            "effective_search_ratio": effective_search_ratio,
-            "query_text": query_text,
-            "fulltext_index_name": fulltext_index_name,
-            "query_vector": embed_query_vector,
-        },
-        database_=None,
-        routing_=neo4j.RoutingControl.READ,
+        query_text=query_text,
+        query_vector=embed_query_vector,
+        top_k=top_k,
+        effective_search_ratio=effective_search_ratio,
+        vector_index_name=vector_index_name,
+        fulltext_index_name=fulltext_index_name,
     )
 
 
-@patch("neo4j_graphrag.retrievers.base.get_version")
 def test_hybrid_retriever_linear_without_alpha(
-    mock_get_version: MagicMock, driver: MagicMock
+    driver: MagicMock
 ) -> None:
-    mock_get_version.return_value = ((5, 23, 0), False, False)
     with pytest.raises(SearchValidationError) as exc_info:
         HybridRetriever(
             driver=driver,
@@ -657,11 +903,9 @@ def test_hybrid_retriever_linear_without_alpha(
     assert "alpha must be provided" in str(exc_info.value)
 
 
-@patch("neo4j_graphrag.retrievers.base.get_version")
 def test_hybrid_cypher_retriever_linear_without_alpha(
-    mock_get_version: MagicMock, driver: MagicMock
+    driver: MagicMock
 ) -> None:
-    mock_get_version.return_value = ((5, 23, 0), False, False)
     with pytest.raises(SearchValidationError) as exc_info:
         HybridCypherRetriever(
             driver=driver,
@@ -675,17 +919,14 @@ def test_hybrid_cypher_retriever_linear_without_alpha(
 
 @patch("neo4j_graphrag.retrievers.hybrid.supports_search_clause", return_value=False)
 @patch("neo4j_graphrag.retrievers.HybridRetriever._fetch_index_infos")
-@patch("neo4j_graphrag.retrievers.base.get_version")
 def test_hybrid_search_linear_ranker_happy_path(
-    mock_get_version: MagicMock,
     _fetch_index_infos_mock: MagicMock,
     _mock_search_clause: MagicMock,
     driver: MagicMock,
     embedder: MagicMock,
     neo4j_record: MagicMock,
 ) -> None:
-    mock_get_version.return_value = ((5, 23, 0), False, False)
-    embed_query_vector = [1.0 for _ in range(1536)]
+    embed_query_vector = _EMBED_QUERY_VECTOR
     embedder.embed_query.return_value = embed_query_vector
     vector_index_name = "vector-index"
     fulltext_index_name = "fulltext-index"
@@ -721,19 +962,16 @@ def test_hybrid_search_linear_ranker_happy_path(
         alpha=alpha,
     )
 
-    retriever.driver.execute_query.assert_called_once_with(  # type: ignore
+    _assert_hybrid_query_call(
+        retriever.driver,  # type: ignore
         search_query,
-        {
-            "vector_index_name": vector_index_name,
-            "top_k": top_k,
-            "effective_search_ratio": effective_search_ratio,
-            "query_text": query_text,
-            "fulltext_index_name": fulltext_index_name,
-            "query_vector": embed_query_vector,
-            "alpha": alpha,
-        },
-        database_=None,
-        routing_=neo4j.RoutingControl.READ,
+        query_text=query_text,
+        query_vector=embed_query_vector,
+        top_k=top_k,
+        effective_search_ratio=effective_search_ratio,
+        extra_params={"alpha": alpha},
+        vector_index_name=vector_index_name,
+        fulltext_index_name=fulltext_index_name,
     )
     embedder.embed_query.assert_called_once_with(query_text)
     assert records == RetrieverResult(
@@ -746,17 +984,14 @@ def test_hybrid_search_linear_ranker_happy_path(
 
 @patch("neo4j_graphrag.retrievers.hybrid.supports_search_clause", return_value=False)
 @patch("neo4j_graphrag.retrievers.HybridCypherRetriever._fetch_index_infos")
-@patch("neo4j_graphrag.retrievers.base.get_version")
 def test_hybrid_cypher_linear_ranker(
-    mock_get_version: MagicMock,
     _fetch_index_infos_mock: MagicMock,
     _mock_search_clause: MagicMock,
     driver: MagicMock,
     embedder: MagicMock,
     neo4j_record: MagicMock,
 ) -> None:
-    mock_get_version.return_value = ((5, 23, 0), False, False)
-    embed_query_vector = [1.0 for _ in range(1536)]
+    embed_query_vector = _EMBED_QUERY_VECTOR
     embedder.embed_query.return_value = embed_query_vector
     vector_index_name = "vector-index"
     fulltext_index_name = "fulltext-index"
@@ -803,20 +1038,16 @@ def test_hybrid_cypher_linear_ranker(
 
     embedder.embed_query.assert_called_once_with(query_text)
 
-    driver.execute_query.assert_called_once_with(
+    _assert_hybrid_query_call(
+        driver,
         search_query,
-        {
-            "vector_index_name": vector_index_name,
-            "top_k": top_k,
-            "effective_search_ratio": effective_search_ratio,
-            "query_text": query_text,
-            "fulltext_index_name": fulltext_index_name,
-            "query_vector": embed_query_vector,
-            "param": "dummy-param",
-            "alpha": alpha,
-        },
-        database_=None,
-        routing_=neo4j.RoutingControl.READ,
+        query_text=query_text,
+        query_vector=embed_query_vector,
+        top_k=top_k,
+        effective_search_ratio=effective_search_ratio,
+        extra_params={"param": "dummy-param", "alpha": alpha},
+        vector_index_name=vector_index_name,
+        fulltext_index_name=fulltext_index_name,
     )
 
     assert records == RetrieverResult(
@@ -835,15 +1066,12 @@ def test_hybrid_cypher_linear_ranker(
 
 @patch("neo4j_graphrag.retrievers.hybrid.supports_search_clause", return_value=False)
 @patch("neo4j_graphrag.retrievers.HybridRetriever._fetch_index_infos")
-@patch("neo4j_graphrag.retrievers.base.get_version")
 def test_hybrid_retriever_invalid_lucene_query_error(
-    mock_get_version: MagicMock,
     _fetch_index_infos_mock: MagicMock,
     _mock_search_clause: MagicMock,
     driver: MagicMock,
     embedder: MagicMock,
 ) -> None:
-    mock_get_version.return_value = ((5, 23, 0), False, False)
 
     error_message = (
         "Failed to invoke procedure `db.index.fulltext.queryNodes`: "
@@ -870,15 +1098,12 @@ def test_hybrid_retriever_invalid_lucene_query_error(
 
 @patch("neo4j_graphrag.retrievers.hybrid.supports_search_clause", return_value=False)
 @patch("neo4j_graphrag.retrievers.HybridCypherRetriever._fetch_index_infos")
-@patch("neo4j_graphrag.retrievers.base.get_version")
 def test_hybrid_cypher_retriever_invalid_lucene_query_error(
-    mock_get_version: MagicMock,
     _fetch_index_infos_mock: MagicMock,
     _mock_search_clause: MagicMock,
     driver: MagicMock,
     embedder: MagicMock,
 ) -> None:
-    mock_get_version.return_value = ((5, 23, 0), False, False)
     retrieval_query = """
         RETURN node.id AS node_id, node.text AS text, score, {test: $param} AS metadata
         """
@@ -915,7 +1140,7 @@ class TestHybridRetrieverSearchClausePath:
 
     @patch("neo4j_graphrag.retrievers.hybrid.supports_search_clause", return_value=True)
     @patch("neo4j_graphrag.retrievers.HybridRetriever._fetch_index_infos")
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_uses_search_clause_naive_ranker(
         self,
         mock_get_version: MagicMock,
@@ -945,7 +1170,7 @@ class TestHybridRetrieverSearchClausePath:
 
     @patch("neo4j_graphrag.retrievers.hybrid.supports_search_clause", return_value=True)
     @patch("neo4j_graphrag.retrievers.HybridRetriever._fetch_index_infos")
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_uses_search_clause_linear_ranker(
         self,
         mock_get_version: MagicMock,
@@ -978,7 +1203,7 @@ class TestHybridRetrieverSearchClausePath:
 
     @patch("neo4j_graphrag.retrievers.hybrid.supports_search_clause", return_value=True)
     @patch("neo4j_graphrag.retrievers.HybridRetriever._fetch_index_infos")
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_falls_back_when_no_node_label(
         self,
         mock_get_version: MagicMock,
@@ -1004,7 +1229,7 @@ class TestHybridRetrieverSearchClausePath:
 
     @patch("neo4j_graphrag.retrievers.hybrid.supports_search_clause", return_value=True)
     @patch("neo4j_graphrag.retrievers.HybridRetriever._fetch_index_infos")
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_search_clause_with_return_properties(
         self,
         mock_get_version: MagicMock,
@@ -1042,7 +1267,7 @@ class TestHybridCypherRetrieverSearchClausePath:
 
     @patch("neo4j_graphrag.retrievers.hybrid.supports_search_clause", return_value=True)
     @patch("neo4j_graphrag.retrievers.HybridCypherRetriever._fetch_index_infos")
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_uses_search_clause_with_retrieval_query(
         self,
         mock_get_version: MagicMock,
@@ -1077,7 +1302,7 @@ class TestHybridCypherRetrieverSearchClausePath:
 
     @patch("neo4j_graphrag.retrievers.hybrid.supports_search_clause", return_value=True)
     @patch("neo4j_graphrag.retrievers.HybridCypherRetriever._fetch_index_infos")
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_falls_back_when_no_node_label(
         self,
         mock_get_version: MagicMock,
@@ -1109,7 +1334,7 @@ class TestHybridCypherRetrieverSearchClausePath:
 
     @patch("neo4j_graphrag.retrievers.hybrid.supports_search_clause", return_value=True)
     @patch("neo4j_graphrag.retrievers.HybridCypherRetriever._fetch_index_infos")
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_search_clause_linear_ranker(
         self,
         mock_get_version: MagicMock,
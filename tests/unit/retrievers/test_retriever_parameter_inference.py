@@ -229,7 +229,7 @@ class TestParameterInference:
 class TestRealRetrieverParameterInference:
     """Test parameter inference on real retriever classes."""
 
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_vector_retriever_parameters(self, mock_get_version):
         """Test VectorRetriever parameter inference."""
         mock_get_version.return_value = ((5, 20, 0), False, False)
@@ -267,7 +267,7 @@ class TestRealRetrieverParameterInference:
             assert properties["query_vector"].description == "Parameter query_vector"
             assert properties["query_text"].description == "Parameter query_text"
 
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_vector_cypher_retriever_parameters(self, mock_get_version):
         """Test VectorCypherRetriever parameter inference."""
         mock_get_version.return_value = ((5, 20, 0), False, False)
@@ -302,7 +302,7 @@ class TestRealRetrieverParameterInference:
             assert properties["query_params"].type == ParameterType.OBJECT
             assert properties["query_params"].additional_properties is True
 
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_hybrid_retriever_parameters(self, mock_get_version):
         """Test HybridRetriever parameter inference."""
         mock_get_version.return_value = ((5, 20, 0), False, False)
@@ -339,7 +339,7 @@ class TestRealRetrieverParameterInference:
             assert properties["alpha"].minimum == 0.0
             assert properties["alpha"].maximum == 1.0
 
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_text2cypher_retriever_parameters(self, mock_get_version):
         """Test Text2CypherRetriever parameter inference."""
         mock_get_version.return_value = ((5, 20, 0), False, False)
@@ -474,7 +474,7 @@ class TestParameterDescriptions:
 class TestOpenAICompatibilityFix:
     """Test the specific fixes for OpenAI API compatibility."""
 
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_text2cypher_retriever_openai_schema_compatibility(self, mock_get_version):
         """Test that Text2CypherRetriever generates OpenAI-compatible schema.
 
@@ -531,7 +531,7 @@ class TestOpenAICompatibilityFix:
         except (TypeError, ValueError) as e:
             pytest.fail(f"Schema is not JSON serializable: {e}")
 
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_tools_retriever_with_t2c_tool_integration(self, mock_get_version):
         """Integration test showing the full ToolsRetriever + Text2CypherRetriever workflow."""
         mock_get_version.return_value = ((5, 20, 0), False, False)
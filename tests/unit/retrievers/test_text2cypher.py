@@ -30,13 +30,13 @@ from neo4j_graphrag.types import RetrieverResult, RetrieverResultItem
 
 
 def test_t2c_retriever_initialization(driver: MagicMock, llm: MagicMock) -> None:
-    with patch("neo4j_graphrag.retrievers.base.get_version") as mock_get_version:
+    with patch("neo4j_graphrag.retrievers.base.get_version_cached") as mock_get_version:
         mock_get_version.return_value = ((5, 23, 0), False, False)
         Text2CypherRetriever(driver, llm, neo4j_schema="dummy-text")
         mock_get_version.assert_called_once()
 
 
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 @patch("neo4j_graphrag.retrievers.text2cypher.get_schema")
 def test_t2c_retriever_schema_retrieval(
     get_schema_mock: MagicMock,
@@ -49,7 +49,7 @@ def test_t2c_retriever_schema_retrieval(
     get_schema_mock.assert_called_once()
 
 
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 @patch("neo4j_graphrag.retrievers.text2cypher.get_schema")
 def test_t2c_retriever_schema_retrieval_failure(
     get_schema_mock: MagicMock,
@@ -63,7 +63,7 @@ def test_t2c_retriever_schema_retrieval_failure(
         Text2CypherRetriever(driver, llm)
 
 
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_t2c_retriever_invalid_neo4j_schema(
     mock_get_version: MagicMock, driver: MagicMock, llm: MagicMock
 ) -> None:
@@ -79,7 +79,7 @@ def test_t2c_retriever_invalid_neo4j_schema(
     assert "Input should be a valid string" in str(exc_info.value)
 
 
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_t2c_retriever_invalid_search_query(
     mock_get_version: MagicMock, driver: MagicMock, llm: MagicMock
 ) -> None:
@@ -94,7 +94,7 @@ def test_t2c_retriever_invalid_search_query(
     assert "Input should be a valid string" in str(exc_info.value)
 
 
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_t2c_retriever_invalid_search_examples(
     mock_get_version: MagicMock, driver: MagicMock, llm: MagicMock
 ) -> None:
@@ -111,7 +111,7 @@ def test_t2c_retriever_invalid_search_examples(
     assert "Initialization failed" in str(exc_info.value)
 
 
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_t2c_retriever_happy_path(
     mock_get_version: MagicMock,
     driver: MagicMock,
@@ -158,7 +158,7 @@ def test_t2c_retriever_happy_path(
     )
 
 
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_t2c_retriever_cypher_error(
     mock_get_version: MagicMock, driver: MagicMock, llm: MagicMock
 ) -> None:
@@ -178,7 +178,7 @@ def test_t2c_retriever_cypher_error(
 
 
 @pytest.mark.parametrize("query_type", ["w", "rw", "s"])
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_t2c_retriever_rejects_non_read_only_query(
     mock_get_version: MagicMock,
     driver: MagicMock,
@@ -209,7 +209,7 @@ def test_t2c_retriever_rejects_non_read_only_query(
     )
 
 
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_t2c_retriever_with_result_format_function(
     mock_get_version: MagicMock,
     driver: MagicMock,
@@ -243,7 +243,7 @@ def test_t2c_retriever_with_result_format_function(
 
 
 @patch("neo4j_graphrag.retrievers.text2cypher.extract_cypher")
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_t2c_retriever_initialization_with_custom_prompt(
     mock_get_version: MagicMock,
     mock_extract_cypher: MagicMock,
@@ -265,7 +265,7 @@ def test_t2c_retriever_initialization_with_custom_prompt(
 
 
 @patch("neo4j_graphrag.retrievers.text2cypher.extract_cypher")
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_t2c_retriever_initialization_with_custom_prompt_and_schema_and_examples(
     mock_get_version: MagicMock,
     mock_extract_cypher: MagicMock,
@@ -297,7 +297,7 @@ def test_t2c_retriever_initialization_with_custom_prompt_and_schema_and_examples
 
 
 @patch("neo4j_graphrag.retrievers.text2cypher.extract_cypher")
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_t2c_retriever_initialization_with_custom_prompt_and_schema_and_examples_for_prompt_params(
     mock_get_version: MagicMock,
     mock_extract_cypher: MagicMock,
@@ -331,7 +331,7 @@ def test_t2c_retriever_initialization_with_custom_prompt_and_schema_and_examples
 
 
 @patch("neo4j_graphrag.retrievers.text2cypher.extract_cypher")
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_t2c_retriever_initialization_with_custom_prompt_and_unused_schema_and_examples(
     mock_get_version: MagicMock,
     mock_extract_cypher: MagicMock,
@@ -368,7 +368,7 @@ def test_t2c_retriever_initialization_with_custom_prompt_and_unused_schema_and_e
 
 
 @patch("neo4j_graphrag.retrievers.text2cypher.extract_cypher")
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_t2c_retriever_invalid_custom_prompt_type(
     mock_get_version: MagicMock,
     mock_extract_cypher: MagicMock,
@@ -387,7 +387,7 @@ def test_t2c_retriever_invalid_custom_prompt_type(
 
 
 @patch("neo4j_graphrag.retrievers.text2cypher.extract_cypher")
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_t2c_retriever_with_custom_prompt_prompt_params(
     mock_get_version: MagicMock,
     mock_extract_cypher: MagicMock,
@@ -414,7 +414,7 @@ def test_t2c_retriever_with_custom_prompt_prompt_params(
 
 
 @patch("neo4j_graphrag.retrievers.text2cypher.extract_cypher")
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_t2c_retriever_with_custom_prompt_bad_prompt_params(
     mock_get_version: MagicMock,
     mock_extract_cypher: MagicMock,
@@ -447,7 +447,7 @@ def test_t2c_retriever_with_custom_prompt_bad_prompt_params(
 
 
 @patch("neo4j_graphrag.retrievers.text2cypher.extract_cypher")
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 @patch("neo4j_graphrag.retrievers.text2cypher.get_schema")
 def test_t2c_retriever_with_custom_prompt_and_schema(
     get_schema_mock: MagicMock,
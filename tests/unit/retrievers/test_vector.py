@@ -34,13 +34,13 @@ from neo4j_graphrag.types import (
 
 
 def test_vector_retriever_initialization(driver: MagicMock) -> None:
-    with patch("neo4j_graphrag.retrievers.base.get_version") as mock_get_version:
+    with patch("neo4j_graphrag.retrievers.base.get_version_cached") as mock_get_version:
         mock_get_version.return_value = ((5, 23, 0), False, False)
         VectorRetriever(driver=driver, index_name="my-index")
         mock_get_version.assert_called_once()
 
 
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_vector_retriever_invalid_index_name(
     mock_get_version: MagicMock, driver: MagicMock
 ) -> None:
@@ -52,7 +52,7 @@ def test_vector_retriever_invalid_index_name(
     assert "Input should be a valid string" in str(exc_info.value)
 
 
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_vector_retriever_invalid_database_name(
     mock_get_version: MagicMock, driver: MagicMock
 ) -> None:
@@ -68,7 +68,7 @@ def test_vector_retriever_invalid_database_name(
     assert "Input should be a valid string" in str(exc_info.value)
 
 
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_vector_cypher_retriever_invalid_retrieval_query(
     mock_get_version: MagicMock, driver: MagicMock
 ) -> None:
@@ -80,7 +80,7 @@ def test_vector_cypher_retriever_invalid_retrieval_query(
         assert "Input should be a valid string" in str(exc_info.value)
 
 
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_vector_cypher_retriever_invalid_database_name(
     mock_get_version: MagicMock, driver: MagicMock
 ) -> None:
@@ -101,7 +101,7 @@ def test_vector_cypher_retriever_invalid_database_name(
 
 
 def test_vector_cypher_retriever_initialization(driver: MagicMock) -> None:
-    with patch("neo4j_graphrag.retrievers.base.get_version") as mock_get_version:
+    with patch("neo4j_graphrag.retrievers.base.get_version_cached") as mock_get_version:
         mock_get_version.return_value = ((5, 23, 0), False, False)
         VectorCypherRetriever(driver=driver, index_name="my-index", retrieval_query="")
         mock_get_version.assert_called_once()
@@ -109,13 +109,14 @@ def test_vector_cypher_retriever_initialization(driver: MagicMock) -> None:
 
 @patch("neo4j_graphrag.retrievers.vector.supports_search_clause", return_value=False)
 @patch("neo4j_graphrag.retrievers.VectorRetriever._fetch_index_infos")
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_similarity_search_vector_happy_path(
     mock_get_version: MagicMock,
     _fetch_index_infos: MagicMock,
     _mock_supports_search: MagicMock,
     driver: MagicMock,
     neo4j_record: MagicMock,
+    vector_search_query: str,
 ) -> None:
     mock_get_version.return_value = ((5, 23, 0), False, False)
     index_name = "my-index"
@@ -131,7 +132,7 @@ def test_similarity_search_vector_happy_path(
         None,
         None,
     ]
-    search_query, _ = get_search_query(SearchType.VECTOR)
+    search_query = vector_search_query
 
     records = retriever.search(
         query_vector=query_vector,
@@ -163,7 +164,7 @@ def test_similarity_search_vector_happy_path(
 
 @patch("neo4j_graphrag.retrievers.vector.supports_search_clause", return_value=False)
 @patch("neo4j_graphrag.retrievers.VectorRetriever._fetch_index_infos")
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_similarity_search_text_happy_path(
     mock_get_version: MagicMock,
     _fetch_index_infos: MagicMock,
@@ -171,6 +172,7 @@ def test_similarity_search_text_happy_path(
     driver: MagicMock,
     embedder: MagicMock,
     neo4j_record: MagicMock,
+    vector_search_query: str,
 ) -> None:
     mock_get_version.return_value = ((5, 23, 0), False, False)
     embed_query_vector = [1.0 for _ in range(1536)]
@@ -185,7 +187,7 @@ def test_similarity_search_text_happy_path(
         None,
         None,
     ]
-    search_query, _ = get_search_query(SearchType.VECTOR)
+    search_query = vector_search_query
 
     records = retriever.search(
         query_text=query_text,
@@ -218,7 +220,7 @@ def test_similarity_search_text_happy_path(
 
 @patch("neo4j_graphrag.retrievers.vector.supports_search_clause", return_value=False)
 @patch("neo4j_graphrag.retrievers.VectorRetriever._fetch_index_infos")
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_similarity_search_text_return_properties(
     mock_get_version: MagicMock,
     _fetch_index_infos: MagicMock,
@@ -312,7 +314,7 @@ def test_vector_retriever_search_both_text_and_vector(
 
 @patch("neo4j_graphrag.retrievers.vector.supports_search_clause", return_value=False)
 @patch("neo4j_graphrag.retrievers.VectorRetriever._fetch_index_infos")
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_vector_retriever_with_result_format_function(
     mock_get_version: MagicMock,
     _fetch_index_infos: MagicMock,
@@ -388,7 +390,7 @@ def test_vector_cypher_retriever_search_both_text_and_vector(
 
 @patch("neo4j_graphrag.retrievers.vector.supports_search_clause", return_value=False)
 @patch("neo4j_graphrag.retrievers.VectorCypherRetriever._fetch_index_infos")
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_retrieval_query_happy_path(
     mock_get_version: MagicMock,
     _fetch_index_infos: MagicMock,
@@ -458,7 +460,7 @@ def test_retrieval_query_happy_path(
 
 @patch("neo4j_graphrag.retrievers.vector.supports_search_clause", return_value=False)
 @patch("neo4j_graphrag.retrievers.VectorCypherRetriever._fetch_index_infos")
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_retrieval_query_with_result_format_function(
     mock_get_version: MagicMock,
     _fetch_index_infos: MagicMock,
@@ -528,7 +530,7 @@ def test_retrieval_query_with_result_format_function(
 
 @patch("neo4j_graphrag.retrievers.vector.supports_search_clause", return_value=False)
 @patch("neo4j_graphrag.retrievers.VectorCypherRetriever._fetch_index_infos")
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_retrieval_query_with_params(
     mock_get_version: MagicMock,
     _fetch_index_infos: MagicMock,
@@ -602,7 +604,7 @@ def test_retrieval_query_with_params(
 
 @patch("neo4j_graphrag.retrievers.vector.supports_search_clause", return_value=False)
 @patch("neo4j_graphrag.retrievers.VectorCypherRetriever._fetch_index_infos")
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_retrieval_query_cypher_error(
     mock_get_version: MagicMock,
     _fetch_index_infos: MagicMock,
@@ -639,7 +641,7 @@ class TestVectorRetrieverSearchClausePath:
 
     @patch("neo4j_graphrag.retrievers.vector.supports_search_clause", return_value=True)
     @patch("neo4j_graphrag.retrievers.VectorRetriever._fetch_index_infos")
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_uses_search_clause_no_filters(
         self,
         mock_get_version: MagicMock,
@@ -665,7 +667,7 @@ class TestVectorRetrieverSearchClausePath:
 
     @patch("neo4j_graphrag.retrievers.vector.supports_search_clause", return_value=True)
     @patch("neo4j_graphrag.retrievers.VectorRetriever._fetch_index_infos")
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_uses_search_clause_with_compatible_filters(
         self,
         mock_get_version: MagicMock,
@@ -697,7 +699,7 @@ class TestVectorRetrieverSearchClausePath:
 
     @patch("neo4j_graphrag.retrievers.vector.supports_search_clause", return_value=True)
     @patch("neo4j_graphrag.retrievers.VectorRetriever._fetch_index_infos")
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_falls_back_with_incompatible_filters(
         self,
         mock_get_version: MagicMock,
@@ -728,7 +730,7 @@ class TestVectorRetrieverSearchClausePath:
 
     @patch("neo4j_graphrag.retrievers.vector.supports_search_clause", return_value=True)
     @patch("neo4j_graphrag.retrievers.VectorRetriever._fetch_index_infos")
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_falls_back_when_no_node_label(
         self,
         mock_get_version: MagicMock,
@@ -753,7 +755,7 @@ class TestVectorRetrieverSearchClausePath:
 
     @patch("neo4j_graphrag.retrievers.vector.supports_search_clause", return_value=True)
     @patch("neo4j_graphrag.retrievers.VectorRetriever._fetch_index_infos")
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_search_clause_with_return_properties(
         self,
         mock_get_version: MagicMock,
@@ -785,7 +787,7 @@ class TestVectorCypherRetrieverSearchClausePath:
 
     @patch("neo4j_graphrag.retrievers.vector.supports_search_clause", return_value=True)
     @patch("neo4j_graphrag.retrievers.VectorCypherRetriever._fetch_index_infos")
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_uses_search_clause_with_retrieval_query(
         self,
         mock_get_version: MagicMock,
@@ -817,7 +819,7 @@ class TestVectorCypherRetrieverSearchClausePath:
 
     @patch("neo4j_graphrag.retrievers.vector.supports_search_clause", return_value=True)
     @patch("neo4j_graphrag.retrievers.VectorCypherRetriever._fetch_index_infos")
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_falls_back_when_no_node_label(
         self,
         mock_get_version: MagicMock,
@@ -844,7 +846,7 @@ class TestVectorCypherRetrieverSearchClausePath:
 
     @patch("neo4j_graphrag.retrievers.vector.supports_search_clause", return_value=True)
     @patch("neo4j_graphrag.retrievers.VectorCypherRetriever._fetch_index_infos")
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_search_clause_with_compatible_filters(
         self,
         mock_get_version: MagicMock,
@@ -878,7 +880,7 @@ class TestVectorCypherRetrieverSearchClausePath:
 
     @patch("neo4j_graphrag.retrievers.vector.supports_search_clause", return_value=True)
     @patch("neo4j_graphrag.retrievers.VectorCypherRetriever._fetch_index_infos")
-    @patch("neo4j_graphrag.retrievers.base.get_version")
+    @patch("neo4j_graphrag.retrievers.base.get_version_cached")
     def test_falls_back_when_search_clause_unsupported_by_database(
         self,
         mock_get_version: MagicMock,
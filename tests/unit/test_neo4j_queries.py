@@ -93,6 +93,15 @@ def test_hybrid_search_basic() -> None:
     assert result.strip() == expected.strip()
 
 
+def test_get_search_query_unfiltered_is_cached() -> None:
+    query_1, params_1 = get_search_query(SearchType.HYBRID)
+    query_2, params_2 = get_search_query(SearchType.HYBRID)
+    # same cached string, but a fresh params dict per call
+    assert query_1 is query_2
+    assert params_1 == {}
+    assert params_1 is not params_2
+
+
 def test_vector_search_with_properties() -> None:
     properties = ["name", "age"]
     expected = (
@@ -51,7 +51,7 @@ def create_mock_llm() -> LLMInterface:
 
 
 # Test conversion with VectorRetriever
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_convert_vector_retriever_to_tool(mock_get_version: MagicMock) -> None:
     """Test conversion of VectorRetriever to a Tool instance with correct attributes."""
     mock_get_version.return_value = ((5, 20, 0), False, False)
@@ -86,7 +86,7 @@ def test_convert_vector_retriever_to_tool(mock_get_version: MagicMock) -> None:
 
 
 # Test conversion with VectorCypherRetriever
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_convert_vector_cypher_retriever_to_tool(mock_get_version: MagicMock) -> None:
     """Test conversion of VectorCypherRetriever to a Tool instance with correct attributes."""
     mock_get_version.return_value = ((5, 20, 0), False, False)
@@ -122,7 +122,7 @@ def test_convert_vector_cypher_retriever_to_tool(mock_get_version: MagicMock) ->
 
 
 # Test conversion with HybridRetriever
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_convert_hybrid_retriever_to_tool(mock_get_version: MagicMock) -> None:
     """Test conversion of HybridRetriever to a Tool instance with correct attributes."""
     mock_get_version.return_value = ((5, 20, 0), False, False)
@@ -159,7 +159,7 @@ def test_convert_hybrid_retriever_to_tool(mock_get_version: MagicMock) -> None:
 
 
 # Test conversion with HybridCypherRetriever
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_convert_hybrid_cypher_retriever_to_tool(mock_get_version: MagicMock) -> None:
     """Test conversion of HybridCypherRetriever to a Tool instance with correct attributes."""
     mock_get_version.return_value = ((5, 20, 0), False, False)
@@ -197,7 +197,7 @@ def test_convert_hybrid_cypher_retriever_to_tool(mock_get_version: MagicMock) ->
 
 
 # Test conversion with Text2CypherRetriever
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_convert_text2cypher_retriever_to_tool(mock_get_version: MagicMock) -> None:
     """Test conversion of Text2CypherRetriever to a Tool instance with correct attributes."""
     mock_get_version.return_value = ((5, 20, 0), False, False)
@@ -223,7 +223,7 @@ def test_convert_text2cypher_retriever_to_tool(mock_get_version: MagicMock) -> N
 
 
 # Test conversion with custom name provided
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_convert_retriever_with_custom_name(
     mock_get_version: MagicMock,
 ) -> None:
@@ -253,7 +253,7 @@ def test_convert_retriever_with_custom_name(
 
 
 # Test conversion with no parameters provided
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_convert_vector_retriever_to_tool_no_parameters(
     mock_get_version: MagicMock,
 ) -> None:
@@ -282,7 +282,7 @@ def test_convert_vector_retriever_to_tool_no_parameters(
 
 
 # Test tool execution for VectorRetriever
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_vector_retriever_tool_execution(mock_get_version: MagicMock) -> None:
     """Test execution of VectorRetriever tool calls the search method with correct arguments."""
     mock_get_version.return_value = ((5, 20, 0), False, False)
@@ -328,7 +328,7 @@ def test_vector_retriever_tool_execution(mock_get_version: MagicMock) -> None:
 
 
 # Test tool execution for HybridRetriever
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_hybrid_retriever_tool_execution(mock_get_version: MagicMock) -> None:
     """Test execution of HybridRetriever tool calls the search method with correct arguments."""
     mock_get_version.return_value = ((5, 20, 0), False, False)
@@ -375,7 +375,7 @@ def test_hybrid_retriever_tool_execution(mock_get_version: MagicMock) -> None:
 
 
 # Test tool execution for Text2CypherRetriever
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_text2cypher_retriever_tool_execution(mock_get_version: MagicMock) -> None:
     """Test execution of Text2CypherRetriever tool calls the search method with correct arguments."""
     mock_get_version.return_value = ((5, 20, 0), False, False)
@@ -414,7 +414,7 @@ def test_text2cypher_retriever_tool_execution(mock_get_version: MagicMock) -> No
 
 
 # Test tool serialization to JSON format
-@patch("neo4j_graphrag.retrievers.base.get_version")
+@patch("neo4j_graphrag.retrievers.base.get_version_cached")
 def test_tool_serialization(mock_get_version: MagicMock) -> None:
     """Test that a Tool instance can be serialized to the required JSON format."""
     mock_get_version.return_value = ((5, 20, 0), False, False)